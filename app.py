@@ -1,45 +1,48 @@
+import importlib
+import logging
 import sys
+import time
+import uuid
 from pathlib import Path
 
 ROOT_DIR = Path(__file__).parent
-VIEWS_DIR = ROOT_DIR / "views"
 
-sys.path.insert(0, str(ROOT_DIR))
-sys.path.insert(0, str(VIEWS_DIR))
+# app.py re-executes on every rerun; add the root to sys.path only once.
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
 
-import importlib.util
-
-def load_view(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+import streamlit as st
 
+from core import filters, importtime, instrumentation, org, tickets
+from core.loader import load_workbook_data
 
-import streamlit as st
-import pandas as pd
+logger = logging.getLogger(__name__)
 
-views_path = ROOT_DIR / "views"
+# -------------------------
+# LAZY VIEW LOADING
+# -------------------------
+# Persona -> (module, render function). A view module is imported the first
+# time its persona is routed to and then reused from sys.modules on every
+# rerun and session. `python -m core.importtime` reports cold import costs.
+VIEWS = {
+    "Program": ("views.program_view", "program_view"),
+    "Operations": ("views.operations_view", "operations_view"),
+    "Leader": ("views.leadership_view", "leadership_view"),
+    "Customer": ("views.customer_view", "customer_view"),
+}
 
-customer_view = load_view(
-    "customer_view",
-    views_path / "customer_view.py"
-).customer_view
 
-leadership_view = load_view(
-    "leadership_view",
-    views_path / "leadership_view.py"
-).leadership_view
+def load_view(persona):
+    module_name, function_name = VIEWS[persona]
 
-operations_view = load_view(
-    "operations_view",
-    views_path / "operations_view.py"
-).operations_view
+    if module_name not in sys.modules:
+        started = time.perf_counter()
+        importlib.import_module(module_name)
+        seconds = time.perf_counter() - started
+        importtime.VIEW_IMPORT_SECONDS[module_name] = seconds
+        logger.info("Imported %s in %.3fs", module_name, seconds)
 
-program_view = load_view(
-    "program_view",
-    views_path / "program_view.py"
-).program_view
+    return getattr(sys.modules[module_name], function_name)
 
 
 # -------------------------
@@ -56,9 +59,6 @@ st.set_page_config(
 if "escalations_log" not in st.session_state:
     st.session_state["escalations_log"] = []
 
-if "customer_tickets" not in st.session_state:
-    st.session_state.customer_tickets = []
-
 if "app_mode" not in st.session_state:
     st.session_state.app_mode = "Demo"
 
@@ -71,30 +71,34 @@ if "logged_in" not in st.session_state:
 if "user_profile" not in st.session_state:
     st.session_state.user_profile = None
 
+if "session_id" not in st.session_state:
+    st.session_state.session_id = uuid.uuid4().hex[:8]
+
+# Tag this rerun's instrumentation samples with the session
+instrumentation.set_session(st.session_state.session_id)
+
 # -------------------------
 # LOAD EXCEL DATA
 # -------------------------
 def load_data():
-    excel_file = "Delivery_governance_data.xlsx"
-
-    orders_master = pd.read_excel(excel_file, sheet_name="Orders_Master")
-    order_task_execution = pd.read_excel(excel_file, sheet_name="Order_Task_Execution")
-    task_dictionary = pd.read_excel(excel_file, sheet_name="Process_Task_Dictionary")
-    hold_reasons = pd.read_excel(excel_file, sheet_name="Hold_Reason_LOV")
-    escalation_matrix = pd.read_excel(excel_file, sheet_name="Escalation_Matrix")
-    login_credentials = pd.read_excel(excel_file, sheet_name="Login_Credentials")
-
-    return {
-        "orders": orders_master,
-        "tasks": order_task_execution,
-        "dictionary": task_dictionary,
-        "holds": hold_reasons,
-        "escalations": escalation_matrix,
-        "login": login_credentials,
-    }
+    # Parsed once per process and shared by every session; re-read only
+    # when the workbook on disk changes.
+    excel_file = ROOT_DIR / "Delivery_governance_data.xlsx"
+
+    with instrumentation.measure("load_data") as span:
+        data = load_workbook_data(excel_file)
+        span.rows = sum(len(df) for df in data.values())
+    return data
 
 data = load_data()
 
+# Build the order bitmap index and org graph with the data, not on first use
+filters.order_facets(data)
+org.org_graph(data)
+
+# Closes resolved tickets in the background, once per process
+tickets.start_auto_close()
+
 # -------------------------
 # LIFECYCLE → OPS TEAM ROUTING
 # -------------------------
@@ -175,18 +179,12 @@ def login_page():
     password = st.text_input("Password", type="password")
 
     if st.button("Login"):
-        creds = data["login"]
+        # Salted-hash lookup on the normalized Login_ID; no frame scan
+        user_record = data.credentials.authenticate(login_id, password)
 
-        user = creds[
-            (creds["Login_ID"] == login_id)
-            & (creds["Password"] == password)
-            & (creds["Active_Flag"] == "Y")
-        ]
-
-        if user.empty:
+        if user_record is None:
             st.error("Invalid credentials or inactive account.")
         else:
-            user_record = user.iloc[0].to_dict()
             st.session_state.logged_in = True
             st.session_state.user_profile = user_record
             st.session_state.persona = user_record["Type"]
@@ -201,6 +199,12 @@ def logout():
     st.session_state.persona = None
     st.rerun()
 
+# Import the routed view before the sidebar, so the diagnostics panel
+# already sees this rerun's import.
+persona_view = None
+if st.session_state.logged_in and st.session_state.persona in VIEWS:
+    persona_view = load_view(st.session_state.persona)
+
 # -------------------------
 # SIDEBAR
 # -------------------------
@@ -212,20 +216,17 @@ if st.session_state.logged_in:
         if st.button("🚪 Logout"):
             logout()
 
+        profile = st.session_state.user_profile
+        if instrumentation.is_admin(profile.get("Login_ID")):
+            from views.diagnostics_view import diagnostics_panel
+            diagnostics_panel(data)
+
 # -------------------------
 # PAGE ROUTING
 # -------------------------
 if not st.session_state.logged_in:
     landing_page()
 
-elif st.session_state.persona == "Program":
-    program_view(data)
-
-elif st.session_state.persona == "Operations":
-    operations_view(data)
-
-elif st.session_state.persona == "Leader":
-    leadership_view(data)
-
-elif st.session_state.persona == "Customer":
-        customer_view(data)
+elif persona_view is not None:
+    with instrumentation.measure(f"view.{st.session_state.persona}"):
+        persona_view(data)
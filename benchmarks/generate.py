@@ -0,0 +1,353 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from core import schema, snapshot
+from core.workbook import SHEETS, file_digest, read_workbook
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+REFERENCE_WORKBOOK = ROOT_DIR / "Delivery_governance_data.xlsx"
+DEFAULT_OUT_DIR = Path(__file__).resolve().parent / "data"
+
+DEFAULT_SEED = 20250101
+BASE_DATE = np.datetime64("2025-01-01")
+
+# Excel's sheet limit, header row included
+EXCEL_MAX_ROWS = 1_048_576
+
+# Order-facing stage name -> the dictionary's stage name
+ORDER_STAGES = {
+    "Lead to Order": "Lead to Order",
+    "Customer Onboarding": "Customer Onboarding",
+    "Build to Order": "Build to Order",
+    "Last Mile Build – Wireless": "Last Mile Build for Wireless (UBR/FWA)",
+    "Last Mile Build – Fiber": "Last Mile Build for Fiber (FTTX/Ethernet)",
+    "Order to Activation": "Order to Activation",
+}
+
+ORDER_PATHS = {
+    "Wireless": [
+        "Lead to Order", "Customer Onboarding", "Build to Order",
+        "Last Mile Build – Wireless", "Order to Activation",
+    ],
+    "Wired": [
+        "Lead to Order", "Customer Onboarding", "Build to Order",
+        "Last Mile Build – Fiber", "Order to Activation",
+    ],
+}
+
+ORDER_TYPE_WEIGHTS = {"Wired": 0.6, "Wireless": 0.4}
+RAG_WEIGHTS = {"Green": 0.55, "Amber": 0.28, "Red": 0.17}
+SLA_BREACH_BY_RAG = {"Green": 0.05, "Amber": 0.2, "Red": 0.7}
+COMPLETED_SHARE = 0.15
+HOLD_SHARE = 0.27
+MEAN_EXTRA_TASKS = 3.5
+
+CUSTOMER_TYPES = ["Enterprise", "SME", "Government"]
+REGIONS = [
+    "Mumbai", "Delhi", "Bengaluru", "Hyderabad", "Chennai",
+    "Pune", "Kolkata", "Ahmedabad",
+]
+
+# Customer portal accounts, one per order from the first orders generated
+CUSTOMER_LOGINS = 10_000
+
+# Team and designation of the engineers working each stage
+STAGE_TEAMS = {
+    "Lead to Order": ("OPS_L2O", "KAM"),
+    "Customer Onboarding": ("OPS_ONBOARDING", "Sales Ops"),
+    "Build to Order": ("OPS_B2O", "Delivery Lead"),
+    "Last Mile Build – Wireless": ("OPS_WL_BUILD", "Field Engineer"),
+    "Last Mile Build – Fiber": ("OPS_FIBER_BUILD", "Field Engineer"),
+    "Order to Activation": ("OPS_INSTALL", "NOC"),
+}
+
+
+def _choice(rng, weights, size):
+    return rng.choice(list(weights), size=size, p=list(weights.values()))
+
+
+def _staff_size(n_orders):
+    # Engineers per stage grow with volume, about one per 500 orders.
+    return int(np.clip(n_orders // 500, 2, 2000))
+
+
+# -------------------------
+# REFERENCE SHEETS
+# -------------------------
+# The task dictionary, hold reasons and escalation matrix describe the
+# process, not the volume, so they are copied from the shipped workbook.
+def reference_frames(path=REFERENCE_WORKBOOK):
+    frames, _ = read_workbook(path)
+    return {key: frames[key] for key in ("dictionary", "holds", "escalations")}
+
+
+# -------------------------
+# LOGINS
+# -------------------------
+def _logins(n_orders, clients):
+    engineers = _staff_size(n_orders)
+    rows = [(
+        "Leader", "leader.01@telcotoday.com", "leader.01@1",
+        None, "Leader.01", "Leadership", None, "Leadership", "Y",
+    )]
+    staff = {}
+
+    for s, (stage, (team, designation)) in enumerate(STAGE_TEAMS.items(), start=1):
+        manager = f"Manager.{s:02d}"
+        rows.append((
+            "Program", f"{manager.lower()}@telcotoday.com", f"{manager.lower()}@1",
+            None, manager, f"Manager_{stage}", "Leader.01",
+            f"Operations_{stage}", "Y",
+        ))
+        staff[stage] = []
+        for e in range(engineers):
+            name = f"Eng.{s:02d}{e:03d}"
+            login = f"{name.lower()}@telcotoday.com"
+            staff[stage].append(login)
+            rows.append((
+                "Operations", login, f"{name.lower()}@1", None, name,
+                designation, manager, team, "Y" if e % 25 else "N",
+            ))
+
+    for client, order_id in clients[:CUSTOMER_LOGINS]:
+        name = f"Cust.{order_id[-6:]}"
+        rows.append((
+            "Customer", f"{name.lower()}@customer.com", f"{name.lower()}@1",
+            order_id, name, None, None, client, "Y",
+        ))
+
+    login_df = pd.DataFrame(rows, columns=[
+        "Type", "Login_ID", "Password", "Order_ID", "POC_Name",
+        "Designation", "Reports to", "Team_Name", "Active_Flag",
+    ])
+    return login_df, staff
+
+
+# -------------------------
+# ORDERS + TASKS
+# -------------------------
+def generate_frames(n_orders, seed=DEFAULT_SEED, reference=None):
+    """All six sheets for ``n_orders`` orders, as raw (un-normalized) frames."""
+    rng = np.random.default_rng(seed)
+    reference = reference or reference_frames()
+    dictionary = reference["dictionary"]
+    hold_codes = reference["holds"]["Hold_Code"].dropna().to_numpy()
+
+    stage_tasks = {
+        stage: dictionary.loc[
+            dictionary["Lifecycle_Stage"] == dict_stage, "Task_ID"
+        ].tolist()
+        for stage, dict_stage in ORDER_STAGES.items()
+    }
+    tat_hours = dict(zip(dictionary["Task_ID"], dictionary["Standard_TAT_Hours"]))
+
+    # Each order type's full task path, with the stage of every step
+    path_tasks = {}
+    path_stages = {}
+    for order_type, stages in ORDER_PATHS.items():
+        path_tasks[order_type] = np.array(
+            [task for stage in stages for task in stage_tasks[stage]]
+        )
+        path_stages[order_type] = np.array(
+            [stage for stage in stages for _ in stage_tasks[stage]]
+        )
+
+    order_ids = np.char.add("ORD_", np.char.zfill(np.arange(1, n_orders + 1).astype(str), 7))
+    n_clients = max(1, n_orders // 20)
+    client_ids = rng.integers(0, n_clients, n_orders)
+    clients = np.char.add("Client ", np.char.zfill(client_ids.astype(str), 6))
+    order_types = _choice(rng, ORDER_TYPE_WEIGHTS, n_orders)
+    start_dates = BASE_DATE - rng.integers(0, 365, n_orders).astype("timedelta64[D]")
+
+    # Position of the current task along the order's path
+    completed = rng.random(n_orders) < COMPLETED_SHARE
+    position = np.empty(n_orders, dtype=np.int64)
+    task_ids = np.empty(n_orders, dtype=object)
+    stages = np.empty(n_orders, dtype=object)
+    for order_type in ORDER_PATHS:
+        rows = order_types == order_type
+        length = len(path_tasks[order_type])
+        position[rows] = rng.integers(0, length, rows.sum())
+        position[rows & completed] = length - 1
+        task_ids[rows] = path_tasks[order_type][position[rows]]
+        stages[rows] = path_stages[order_type][position[rows]]
+    stages[completed] = "Completed"
+
+    rag = _choice(rng, RAG_WEIGHTS, n_orders)
+    breach_p = pd.Series(rag).map(SLA_BREACH_BY_RAG).to_numpy()
+    sla = np.where(rng.random(n_orders) < breach_p, "Yes", "No")
+
+    # Task rows: the last k steps up to (and including) the current task
+    k = np.minimum(position + 1, 1 + rng.poisson(MEAN_EXTRA_TASKS, n_orders))
+    order_rep = np.repeat(np.arange(n_orders), k)
+    step = np.arange(k.sum()) - np.repeat(np.cumsum(k) - k, k)
+    task_pos = position[order_rep] - k[order_rep] + 1 + step
+    is_current = step == k[order_rep] - 1
+
+    task_type = order_types[order_rep]
+    task_id = np.empty(len(order_rep), dtype=object)
+    task_stage = np.empty(len(order_rep), dtype=object)
+    for order_type in ORDER_PATHS:
+        rows = task_type == order_type
+        task_id[rows] = path_tasks[order_type][task_pos[rows]]
+        task_stage[rows] = path_stages[order_type][task_pos[rows]]
+
+    in_progress = is_current & ~completed[order_rep]
+    has_hold = rng.random(len(order_rep)) < HOLD_SHARE
+    on_hold = np.zeros(n_orders, dtype=bool)
+    on_hold[order_rep[in_progress & has_hold]] = True
+
+    order_status = np.where(
+        completed, "Completed", np.where(on_hold, "On Hold", "In Progress")
+    )
+
+    login_df, staff = _logins(
+        n_orders, list(zip(clients.tolist(), order_ids.tolist()))
+    )
+    assignee = np.empty(len(order_rep), dtype=object)
+    team = np.empty(len(order_rep), dtype=object)
+    for stage, logins in staff.items():
+        rows = task_stage == stage
+        assignee[rows] = rng.choice(logins, rows.sum())
+        team[rows] = STAGE_TEAMS[stage][1]
+
+    task_start = (
+        start_dates[order_rep]
+        + (task_pos * 2 + rng.integers(0, 2, len(order_rep))).astype("timedelta64[D]")
+    )
+    hours = pd.Series(task_id).map(tat_hours).to_numpy(dtype=float)
+    actual_hours = np.maximum(1, np.round(hours * rng.lognormal(0, 0.5, len(task_id))))
+
+    orders_df = pd.DataFrame({
+        "Order_ID": order_ids,
+        "Client_Name": clients,
+        "POC_Name": np.char.add("Contact ", client_ids.astype(str)),
+        "Customer Type": rng.choice(CUSTOMER_TYPES, n_orders, p=[0.6, 0.3, 0.1]),
+        "Order_Type": order_types,
+        "Circle/Region": rng.choice(REGIONS, n_orders),
+        "Lifecycle_Stage": stages,
+        "Current_Task_ID": task_ids,
+        "Order_Start_Date": pd.to_datetime(start_dates),
+        "Order_Status": order_status,
+        "Overall_RAG": rag,
+        "SLA_Breach_Flag": sla,
+    })
+
+    tasks_df = pd.DataFrame({
+        "Order_ID": order_ids[order_rep],
+        "Task_ID": task_id,
+        "Lifecycle_Stage": task_stage,
+        "Assigned_To_POC": assignee,
+        "Assigned_To_Team": team,
+        "Task_Status": np.where(in_progress, "In Progress", "Completed"),
+        "Task_Start_Date": pd.to_datetime(task_start),
+        "Actual_Hours": actual_hours.astype(np.int64),
+        "Hold_Reason_Code": np.where(
+            has_hold, rng.choice(hold_codes, len(order_rep)), None
+        ),
+        "Reassignment_Requested": np.where(rng.random(len(order_rep)) < 0.05, "Yes", "No"),
+        "Escalation_Triggered": np.where(rng.random(len(order_rep)) < 0.15, "Yes", "No"),
+    })
+
+    frames = {
+        "orders": orders_df,
+        "tasks": tasks_df,
+        "login": login_df,
+    }
+    frames.update({key: df.copy() for key, df in reference.items()})
+    return {key: frames[key] for key in SHEETS}
+
+
+# -------------------------
+# OUTPUT
+# -------------------------
+def fits_in_excel(frames):
+    return all(len(df) < EXCEL_MAX_ROWS for df in frames.values())
+
+
+def _cell(value):
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def write_workbook(frames, path):
+    workbook = openpyxl.Workbook(write_only=True)
+    for key, sheet_name in SHEETS.items():
+        sheet = workbook.create_sheet(sheet_name)
+        df = frames[key]
+        sheet.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            sheet.append([_cell(value) for value in row])
+    workbook.save(path)
+
+
+def scale_paths(n_orders, out_dir=DEFAULT_OUT_DIR):
+    workbook_path = Path(out_dir) / f"governance_{n_orders}.xlsx"
+    return workbook_path, snapshot.default_snapshot_dir(workbook_path)
+
+
+def generate(n_orders, out_dir=DEFAULT_OUT_DIR, seed=DEFAULT_SEED, xlsx=True):
+    """Write the synthetic data set for ``n_orders`` and return its paths.
+
+    The columnar snapshot is always written (it needs pyarrow). The xlsx is
+    written only when asked for and every sheet fits Excel's row limit;
+    otherwise the returned workbook path is None.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    workbook_path, snapshot_dir = scale_paths(n_orders, out_dir)
+
+    frames = generate_frames(n_orders, seed)
+
+    workbook_digest = None
+    if xlsx and fits_in_excel(frames):
+        write_workbook(frames, workbook_path)
+        workbook_digest = file_digest(workbook_path)
+    else:
+        workbook_path = None
+
+    # Tagged with the xlsx digest so the loader takes it as fresh.
+    snapshot.write_snapshot(schema.normalize(frames), snapshot_dir, workbook_digest)
+    return workbook_path, snapshot_dir
+
+
+def parse_scale(value):
+    """'10k' -> 10000, '1M' -> 1000000, '2500' -> 2500."""
+    value = str(value).strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(value[-1:], 1)
+    if multiplier > 1:
+        value = value[:-1]
+    return int(float(value) * multiplier)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic governance workbook and snapshot."
+    )
+    parser.add_argument("--orders", default="10k", help="Order count, e.g. 10k, 100k, 1M")
+    parser.add_argument("--out", default=str(DEFAULT_OUT_DIR), help="Output directory")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument(
+        "--no-xlsx", action="store_true", help="Write the columnar snapshot only"
+    )
+    args = parser.parse_args(argv)
+
+    workbook_path, snapshot_dir = generate(
+        parse_scale(args.orders), args.out, args.seed, xlsx=not args.no_xlsx
+    )
+    if workbook_path is not None:
+        print(f"Workbook written to {workbook_path}")
+    print(f"Snapshot written to {snapshot_dir}")
+
+
+if __name__ == "__main__":
+    main()
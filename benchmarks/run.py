@@ -0,0 +1,352 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.generate import (
+    DEFAULT_OUT_DIR,
+    DEFAULT_SEED,
+    generate,
+    parse_scale,
+    scale_paths,
+)
+from core import cards, derived, filters, indexes, instrumentation, org, search, snapshot
+from core.loader import GovernanceData, build_data, clear_cache, load_workbook_data
+from core.pagination import make_page, page_slice
+
+DEFAULT_SCALES = ["10k", "100k", "1M"]
+DEFAULT_REPEAT = 5
+DEFAULT_COLD_REPEAT = 3
+DEFAULT_THRESHOLD = 1.5
+
+# Slowdowns smaller than this are scheduler noise, whatever the ratio.
+NOISE_FLOOR_SECONDS = 0.005
+
+# Best-of-N timings are compared; medians and single runs are too noisy.
+COMPARED_METRICS = ("cold_min_seconds", "warm_min_seconds")
+
+# Scales above this are benchmarked from the snapshot only; their workbooks
+# are slow to write and read, and past ~240k orders the task sheet no
+# longer fits in an xlsx at all.
+DEFAULT_XLSX_MAX = "100k"
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+
+# -------------------------
+# VIEW DATA PREP (HEADLESS)
+# -------------------------
+# Each mirrors the data work its view does on a rerun, without Streamlit.
+def _sample(data):
+    """Representative keys: a busy engineer, a manager, an order, a customer."""
+    tasks_df = data["tasks"]
+    in_progress = tasks_df[tasks_df["status_clean"] == "in progress"]
+    login_df = data["login"]
+
+    return {
+        "engineer": in_progress["assigned_clean"].value_counts().index[0],
+        "manager": login_df.loc[login_df["Type"] == "Program", "login_clean"].iloc[0],
+        "order_id": data["orders"]["Order_ID"].iloc[len(data["orders"]) // 2],
+        "customer_order_id": login_df.loc[
+            login_df["Type"] == "Customer", "Order_ID"
+        ].iloc[0],
+    }
+
+
+def program_prep(data, sample):
+    cube = derived.kpi_cube(data)
+    derived.ageing_summary(data)
+    orders_df = derived.orders_with_ageing(data)
+
+    facets = filters.order_facets(data)
+    selections = {"Overall_RAG": ["Red"], "SLA_Breach_Flag": ["Yes"]}
+    for column in filters.ORDER_FACETS:
+        facets.facet_counts(column, selections)
+    positions = filters.filtered_positions(data, selections, filters.FilterCache())
+    orders_df.iloc[positions][["Order_ID", "Client_Name", "Order_Ageing_Days"]]
+
+    order_search = search.order_search(data)
+    order_search.matches(sample["order_id"][:8])
+    order_search.matches("client 00")
+
+    indexes.orders_by_id(data).first(sample["order_id"])
+    indexes.tasks_by_order(data).rows(sample["order_id"])
+    org.org_graph(data).all_reportees(sample["manager"])
+    return cube.total_orders
+
+
+def operations_prep(data, sample):
+    my_tasks = indexes.tasks_by_assignee(data).rows(sample["engineer"])
+    my_active_tasks = my_tasks[
+        my_tasks["status_clean"] == "in progress"
+    ].sort_values("Task_Start_Date", kind="stable")
+
+    page = make_page(len(my_active_tasks))
+    task_cards = cards.task_cards(page_slice(my_active_tasks, page))
+
+    order_tasks_index = indexes.tasks_by_order(data)
+    for card in task_cards:
+        order_tasks = order_tasks_index.rows(card.order_id)
+        order_tasks[order_tasks["status_clean"] == "completed"]
+    return len(my_active_tasks)
+
+
+def leadership_prep(data, sample):
+    cube = derived.kpi_cube(data)
+    ageing = derived.ageing_summary(data)
+    cube.rag_distribution.rename_axis("RAG").to_frame("Order_Count")
+    cube.breaches_by_stage.to_frame("Breach_Count")
+    cube.ageing_trend(ageing.today).to_frame()
+    cube.sla_breach_trend().to_frame()
+    orders_df = data["orders"]
+    if "Hold_Reason_Code" in orders_df.columns:
+        orders_df["Hold_Reason_Code"].dropna().value_counts().head(5)
+    return cube.total_orders
+
+
+def customer_prep(data, sample):
+    order = indexes.orders_by_id(data).first(sample["customer_order_id"])
+    indexes.tasks_by_order(data).first(sample["customer_order_id"])
+    return order is not None
+
+
+VIEW_PREP = {
+    "program": program_prep,
+    "operations": operations_prep,
+    "leadership": leadership_prep,
+    "customer": customer_prep,
+}
+
+
+# -------------------------
+# TIMING
+# -------------------------
+def _fresh(data):
+    # Same frames, empty derive cache: the next call pays the build cost.
+    return GovernanceData(
+        {key: dict.__getitem__(data, key) for key in data},
+        data.version,
+        data.load_report,
+        data.credentials,
+        data.rag_policy,
+    )
+
+
+def _time(func, *args):
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+def _load(workbook_path, snapshot_dir):
+    # The app's own entry point: stat key, digest, snapshot freshness check
+    # and the snapshot read, from an empty process cache.
+    clear_cache()
+    return load_workbook_data(workbook_path, snapshot_dir=snapshot_dir)
+
+
+def _load_workbook(workbook_path):
+    # An empty snapshot dir forces the xlsx parse.
+    with tempfile.TemporaryDirectory() as empty_dir:
+        return _load(workbook_path, empty_dir)
+
+
+def _load_snapshot_direct(snapshot_dir):
+    # Scales with no workbook to fingerprint: read the snapshot straight.
+    frames, report = snapshot.read_snapshot(snapshot_dir)
+    return build_data(frames, snapshot_dir.name, report)
+
+
+def bench_scale(n_orders, out_dir, seed, repeat, cold_repeat, xlsx, regenerate):
+    workbook_path, snapshot_dir = scale_paths(n_orders, out_dir)
+
+    if regenerate or not snapshot_dir.exists() or (xlsx and not workbook_path.exists()):
+        workbook_path, _ = generate(n_orders, out_dir, seed, xlsx=xlsx)
+    if not (xlsx and workbook_path and workbook_path.exists()):
+        workbook_path = None
+
+    results = []
+
+    def record(step, cold, warm=()):
+        results.append({
+            "scale": n_orders,
+            "step": step,
+            "cold_median_seconds": statistics.median(cold),
+            "cold_min_seconds": min(cold),
+            "warm_median_seconds": statistics.median(warm) if warm else None,
+            "warm_min_seconds": min(warm) if warm else None,
+        })
+
+    if workbook_path is not None:
+        # The xlsx parse takes minutes at 100k; one run is enough to see it.
+        record("load.workbook", [_time(_load_workbook, workbook_path)])
+        record("load.snapshot", [
+            _time(_load, workbook_path, snapshot_dir) for _ in range(cold_repeat)
+        ])
+        data = _load(workbook_path, snapshot_dir)
+    else:
+        # Past Excel's row limit there is no workbook, so the loader's cache
+        # and freshness checks can't run; this times the read and bundle only.
+        record("load.snapshot_direct", [
+            _time(_load_snapshot_direct, snapshot_dir) for _ in range(cold_repeat)
+        ])
+        data = _load_snapshot_direct(snapshot_dir)
+
+    sample = _sample(data)
+
+    for view, prep in VIEW_PREP.items():
+        cold = []
+        for _ in range(cold_repeat):
+            view_data = _fresh(data)
+            cold.append(_time(prep, view_data, sample))
+        warm = [_time(prep, view_data, sample) for _ in range(repeat)]
+        record(f"prep.{view}", cold, warm)
+
+    rows = {key: len(df) for key, df in data.items()}
+    return results, rows
+
+
+# -------------------------
+# REPORT
+# -------------------------
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _versions():
+    versions = {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+    if snapshot.snapshot_available():
+        import pyarrow
+        versions["pyarrow"] = pyarrow.__version__
+    return versions
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Steps slower than ``threshold`` x the baseline, as (scale, step, metric, ratio).
+
+    Only best-of-N timings are compared, and a slowdown must also exceed
+    NOISE_FLOOR_SECONDS in absolute terms.
+    """
+    previous = {
+        (row["scale"], row["step"]): row for row in baseline["results"]
+    }
+    regressions = []
+
+    for row in report["results"]:
+        before = previous.get((row["scale"], row["step"]))
+        if before is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if row.get(metric) is None or not before.get(metric):
+                continue
+            if row[metric] - before[metric] < NOISE_FLOOR_SECONDS:
+                continue
+            ratio = row[metric] / before[metric]
+            if ratio > threshold:
+                regressions.append((row["scale"], row["step"], metric, ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Time load_data and each view's data prep on synthetic data."
+    )
+    parser.add_argument(
+        "--scales", nargs="+", default=DEFAULT_SCALES,
+        help="Order counts, e.g. 10k 100k 1M",
+    )
+    parser.add_argument("--data", default=str(DEFAULT_OUT_DIR), help="Synthetic data directory")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Warm runs per step")
+    parser.add_argument(
+        "--cold-repeat", type=int, default=DEFAULT_COLD_REPEAT,
+        help="Cold runs per step, each on an empty derive cache",
+    )
+    parser.add_argument(
+        "--xlsx-max", default=DEFAULT_XLSX_MAX,
+        help="Largest scale also benchmarked from an xlsx workbook",
+    )
+    parser.add_argument("--regenerate", action="store_true", help="Rebuild the synthetic data")
+    parser.add_argument("--out", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Baseline JSON report to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Slowdown ratio reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    xlsx_max = parse_scale(args.xlsx_max)
+    metrics = instrumentation.get_metrics_store()
+    metrics.clear()
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": pd.Timestamp.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "cold_repeat": args.cold_repeat,
+            "versions": _versions(),
+        },
+        "results": [],
+        "rows": {},
+    }
+
+    for scale in args.scales:
+        n_orders = parse_scale(scale)
+        print(f"Benchmarking {n_orders} orders...", file=sys.stderr)
+        results, rows = bench_scale(
+            n_orders, args.data, args.seed, args.repeat, args.cold_repeat,
+            xlsx=n_orders <= xlsx_max, regenerate=args.regenerate,
+        )
+        report["results"].extend(results)
+        report["rows"][str(n_orders)] = rows
+
+    report["hooks"] = json.loads(
+        metrics.summary().reset_index().to_json(orient="records")
+    )
+
+    print(
+        pd.DataFrame(report["results"])
+        .set_index(["scale", "step"])
+        .to_string(float_format=lambda v: f"{v:.4f}")
+    )
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2))
+        print(f"Report written to {args.out}", file=sys.stderr)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(report, baseline, args.threshold)
+        for scale, step, metric, ratio in regressions:
+            print(f"REGRESSION {scale} {step} {metric}: {ratio:.2f}x baseline")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:g}x baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
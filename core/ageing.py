@@ -0,0 +1,84 @@
+import datetime
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# (label, lower bound in days, upper bound in days, exclusive; None = open)
+AGEING_BUCKETS = [
+    ("0-30 days", 0, 31),
+    ("31-60 days", 31, 61),
+    ("61-90 days", 61, 91),
+    ("90+ days", 91, None),
+]
+
+AgeingSummary = namedtuple("AgeingSummary", ["today", "mean_days", "buckets"])
+
+
+def today_epoch_day():
+    return int(np.datetime64(datetime.date.today(), "D").astype("int64"))
+
+
+# -------------------------
+# AGEING PROFILE
+# -------------------------
+class AgeingProfile:
+    """Start dates as epoch-day integers, prepared once per data version.
+
+    Everything that depends on "today" is then cheap when the date rolls
+    over: ageing is one integer subtraction, the mean comes from a cached
+    sum, and bucket counts are binary searches over the sorted start days.
+    """
+
+    def __init__(self, start_dates):
+        start_dates = pd.to_datetime(start_dates, errors="coerce")
+        self._valid = start_dates.notna().to_numpy()
+        self._start_days = (
+            start_dates.dt.floor("D")
+            .to_numpy(dtype="datetime64[D]")
+            .astype("int64")
+        )
+        self._index = start_dates.index
+
+        valid_days = self._start_days[self._valid]
+        self._sorted_days = np.sort(valid_days)
+        self._count = len(valid_days)
+        self._sum = int(valid_days.sum()) if self._count else 0
+
+    def ageing_days(self, today):
+        """Ageing per order in days; NaN where the start date is missing."""
+        ages = today - self._start_days
+        if not self._valid.all():
+            ages = np.where(self._valid, ages, np.nan)
+        return pd.Series(ages, index=self._index, name="Order_Ageing_Days")
+
+    def ageing_days_at(self, positions, today):
+        """Ageing for the orders at ``positions`` only; NaN where missing."""
+        positions = np.asarray(positions, dtype="int64")
+        ages = today - self._start_days[positions]
+        if not self._valid.all():
+            ages = np.where(self._valid[positions], ages, np.nan)
+        return ages
+
+    def mean_days(self, today):
+        if not self._count:
+            return float("nan")
+        return today - self._sum / self._count
+
+    def bucket_counts(self, today, buckets=AGEING_BUCKETS):
+        counts = {}
+        for label, lower, upper in buckets:
+            # age >= lower  <=>  start_day <= today - lower
+            hi = np.searchsorted(self._sorted_days, today - lower, side="right")
+            lo = 0
+            if upper is not None:
+                lo = np.searchsorted(self._sorted_days, today - upper, side="right")
+            counts[label] = int(hi - lo)
+        return counts
+
+    def summary(self, today):
+        return AgeingSummary(
+            today=today,
+            mean_days=self.mean_days(today),
+            buckets=self.bucket_counts(today),
+        )
@@ -0,0 +1,122 @@
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Render models are namedtuples (``__slots__ = ()``): one small tuple per
+# card instead of a boxed Series per row, with every string preformatted.
+TaskCard = namedtuple(
+    "TaskCard",
+    ["order_id", "header", "current", "next_task"]
+)
+
+TicketCard = namedtuple(
+    "TicketCard",
+    ["ticket_id", "status", "version", "assignee", "body"]
+)
+
+# (label, column, shown as code)
+OPS_TICKET_FIELDS = [
+    ("🎫 Ticket ID", "Ticket_ID", True),
+    ("📦 Order ID", "Order_ID", True),
+    ("🛠 Task ID", "Task_ID", True),
+    ("👤 Customer", "Customer_Name", False),
+    ("📂 Category", "Category", False),
+    ("📝 Description", "Description", False),
+    ("📌 Status", "Status", False),
+    ("⏱ Raised On", "Raised_On", False),
+]
+
+TEAM_TICKET_FIELDS = [
+    ("🎫 Ticket ID", "Ticket_ID", True),
+    ("📦 Order ID", "Order_ID", True),
+    ("🛠 Task ID", "Task_ID", True),
+    ("👤 Customer", "Customer_Name", False),
+    ("👨‍🔧 Assigned Engineer", "Assigned_To_POC", False),
+    ("📌 Status", "Status", False),
+    ("⏱ Raised On", "Raised_On", False),
+]
+
+LINE_BREAK = "  \n"
+
+
+def _text(df, column, missing="N/A"):
+    """``column`` as a Series of display strings, blanks shown as ``missing``."""
+    if column not in df.columns:
+        return pd.Series(missing, index=df.index, dtype=object)
+    values = df[column]
+    return values.astype(str).astype(object).where(values.notna(), missing)
+
+
+def _lines(df, fields):
+    body = pd.Series("", index=df.index, dtype=object)
+    for i, (label, column, code) in enumerate(fields):
+        value = _text(df, column)
+        if code:
+            value = "`" + value + "`"
+        body = body + (LINE_BREAK if i else "") + f"**{label}:** " + value
+    return body
+
+
+# -------------------------
+# TASK CARDS
+# -------------------------
+def task_cards(tasks_df):
+    """Inbox cards for in-progress tasks, formatted in one pass per column."""
+    if tasks_df.empty:
+        return []
+
+    header = (
+        "### 📦 Order `" + _text(tasks_df, "Order_ID") + "` — "
+        + _text(tasks_df, "Lifecycle_Stage")
+    )
+    current = _lines(tasks_df, [
+        ("Task ID", "Task_ID", False),
+        ("Task Name", "Task_Name", False),
+        ("Started On", "Task_Start_Date", False),
+    ])
+    upcoming = _lines(tasks_df, [
+        ("Task ID", "Next_Task_ID", False),
+        ("Task Name", "Next_Task_Name", False),
+    ])
+
+    in_sequence = tasks_df["in_task_sequence"].to_numpy(dtype=bool)
+    is_last = tasks_df["Next_Task_ID"].isna().to_numpy()
+    next_task = np.select(
+        [~in_sequence, is_last],
+        [
+            "Next task not found in dictionary.",
+            "🎯 This is the final task in this lifecycle.",
+        ],
+        default=upcoming.to_numpy()
+    )
+
+    return list(map(
+        TaskCard._make,
+        zip(
+            tasks_df["Order_ID"].tolist(),
+            header.tolist(),
+            current.tolist(),
+            next_task.tolist(),
+        )
+    ))
+
+
+# -------------------------
+# TICKET CARDS
+# -------------------------
+def ticket_cards(tickets_df, fields=OPS_TICKET_FIELDS):
+    """Ticket cards with the markdown for ``fields`` built in bulk."""
+    if tickets_df.empty:
+        return []
+
+    return list(map(
+        TicketCard._make,
+        zip(
+            tickets_df["Ticket_ID"].tolist(),
+            tickets_df["Status"].tolist(),
+            tickets_df["Version"].tolist(),
+            tickets_df["Assigned_To_POC"].astype(str).str.strip().str.lower().tolist(),
+            _lines(tickets_df, fields).tolist(),
+        )
+    ))
@@ -0,0 +1,74 @@
+import hashlib
+import hmac
+import os
+
+from core.schema import clean_key
+
+HASH_NAME = "sha256"
+SALT_BYTES = 16
+
+# Columns never copied into a login profile
+SECRET_COLUMNS = ["Password"]
+
+# Keys the password hashes; never leaves this process.
+_PROCESS_SECRET = os.urandom(32)
+
+
+def hash_password(password, salt, secret=_PROCESS_SECRET):
+    # The plaintext already sits in the workbook and snapshot on disk, so a
+    # slow KDF buys nothing; a keyed hash keeps it out of memory cheaply.
+    return hmac.new(
+        secret, salt + str(password).encode("utf-8"), HASH_NAME
+    ).digest()
+
+
+# -------------------------
+# CREDENTIAL STORE
+# -------------------------
+class CredentialStore:
+    """Salted password hashes keyed on the normalized Login_ID.
+
+    Built once per data version from the Login_Credentials sheet. Login is
+    a dict lookup plus one HMAC and a constant-time compare, and the store
+    keeps no plaintext passwords. Only active accounts are loaded.
+    """
+
+    def __init__(self, login_df):
+        self._entries = {}
+
+        active = login_df[login_df["is_active"] & login_df["Password"].notna()]
+        keys = clean_key(active["Login_ID"]).tolist()
+        passwords = active["Password"].tolist()
+        profiles = active.drop(
+            columns=[c for c in SECRET_COLUMNS if c in active.columns]
+        ).to_dict("records")
+        salts = [os.urandom(SALT_BYTES) for _ in passwords]
+        digests = [
+            hash_password(password, salt)
+            for password, salt in zip(passwords, salts)
+        ]
+
+        for key, salt, digest, profile in zip(keys, salts, digests, profiles):
+            # A duplicated Login_ID resolves to its first active row.
+            self._entries.setdefault(key, (salt, digest, profile))
+
+        # Unknown logins are checked against this so they cost the same time.
+        self._dummy = (
+            os.urandom(SALT_BYTES), bytes(hashlib.new(HASH_NAME).digest_size)
+        )
+
+    def __contains__(self, login_id):
+        return str(login_id).strip().lower() in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def authenticate(self, login_id, password):
+        """The account's profile (without secrets) or None."""
+        entry = self._entries.get(str(login_id).strip().lower())
+        salt, digest, profile = entry if entry else (*self._dummy, None)
+
+        candidate = hash_password(password, salt)
+        if not hmac.compare_digest(candidate, digest) or profile is None:
+            return None
+        return dict(profile)
@@ -0,0 +1,93 @@
+from core.ageing import AgeingProfile, today_epoch_day
+from core.kpis import KpiCube
+from core.lifecycle import build_task_sequence, with_task_sequence
+from core.rag import derive_rag
+
+# -------------------------
+# ORDERS
+# -------------------------
+def _orders_with_rag(data, policy):
+    orders_df = data["orders"]
+    orders_df["Derived_RAG"] = derive_rag(orders_df, policy)
+    return orders_df
+
+
+def orders_with_rag(data):
+    """Orders plus the categorical ``Derived_RAG`` under ``data.rag_policy``.
+
+    Built once per data version and policy.
+    """
+    policy = data.rag_policy
+    return data.derive(
+        ("orders_with_rag", policy.name),
+        lambda d: _orders_with_rag(d, policy)
+    )
+
+
+def ageing_profile(data):
+    return data.derive(
+        "ageing_profile",
+        lambda d: AgeingProfile(d["orders"]["Order_Start_Date"])
+    )
+
+
+def _orders_with_ageing(data, today):
+    orders_df = orders_with_rag(data)
+    orders_df["Order_Ageing_Days"] = ageing_profile(data).ageing_days(today)
+    return orders_df
+
+
+def orders_with_ageing(data):
+    """Orders plus ``Derived_RAG`` and ``Order_Ageing_Days``.
+
+    Ageing is shared until the date rolls over.
+    """
+    today = today_epoch_day()
+    return data.derive(
+        ("orders_with_ageing", data.rag_policy.name),
+        lambda d: _orders_with_ageing(d, today),
+        day=today
+    )
+
+
+def ageing_summary(data):
+    """Mean ageing and ageing buckets for today; use this for KPI tiles."""
+    today = today_epoch_day()
+    return data.derive(
+        "ageing_summary",
+        lambda d: ageing_profile(d).summary(today),
+        day=today
+    )
+
+
+def kpi_cube(data):
+    """Pre-aggregated order KPIs for the dashboard tiles and charts."""
+    return data.derive(
+        ("kpi_cube", data.rag_policy.name),
+        lambda d: KpiCube(orders_with_rag(d))
+    )
+
+
+# -------------------------
+# TASKS
+# -------------------------
+def _enriched_tasks(data):
+    tasks_df = data["tasks"].merge(
+        data["dictionary"][["Task_ID", "Task_Name", "Lifecycle_Stage"]],
+        on="Task_ID",
+        how="left",
+        suffixes=("", "_dict")
+    )
+    return with_task_sequence(tasks_df, task_sequence(data))
+
+
+def enriched_tasks(data):
+    """Execution rows with their dictionary Task_Name and next/previous task."""
+    return data.derive("enriched_tasks", _enriched_tasks)
+
+
+def task_sequence(data):
+    return data.derive(
+        "task_sequence",
+        lambda d: build_task_sequence(d["dictionary"])
+    )
@@ -0,0 +1,150 @@
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from core import instrumentation
+
+# Portfolio filter facets on the orders sheet
+ORDER_FACETS = ["Overall_RAG", "SLA_Breach_Flag", "Lifecycle_Stage", "Order_Type"]
+
+DEFAULT_CACHE_SIZE = 32
+
+
+def _pack(mask):
+    return np.packbits(mask, bitorder="little")
+
+
+def _popcount(bits):
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bits).sum())
+    return int(np.unpackbits(bits).sum())
+
+
+# -------------------------
+# BITMAP INDEX
+# -------------------------
+class FacetBitmaps:
+    """Bitmap index: one packed bitset per distinct value of each facet.
+
+    Built in a single factorize pass per column. A filter is an OR of the
+    selected values' bitsets within a facet and an AND across facets, so it
+    touches one bit per order rather than comparing strings, and facet
+    counts are popcounts over the same bitsets.
+    """
+
+    def __init__(self, df, columns):
+        self.size = len(df)
+        self._all = _pack(np.ones(self.size, dtype=bool))
+        self._bitmaps = {}
+
+        for column in columns:
+            codes, uniques = pd.factorize(df[column], sort=True)
+            self._bitmaps[column] = {
+                value: _pack(codes == code) for code, value in enumerate(uniques)
+            }
+
+    def values(self, column):
+        """Distinct non-null values of ``column``, sorted."""
+        return list(self._bitmaps[column])
+
+    def bitset(self, selections, exclude=None):
+        """Packed rows matching every facet except ``exclude``.
+
+        An empty selection for a facet matches everything.
+        """
+        result = self._all.copy()
+
+        for column, values in selections.items():
+            if not values or column == exclude:
+                continue
+            bitmaps = self._bitmaps[column]
+            selected = np.zeros_like(result)
+            for value in values:
+                if value in bitmaps:
+                    selected |= bitmaps[value]
+            result &= selected
+
+        return result
+
+    def mask(self, selections):
+        bits = np.unpackbits(self.bitset(selections), count=self.size, bitorder="little")
+        return bits.astype(bool)
+
+    def positions(self, selections):
+        return np.flatnonzero(self.mask(selections))
+
+    def count(self, selections):
+        return _popcount(self.bitset(selections))
+
+    def facet_counts(self, column, selections):
+        """Matches per value of ``column`` under the other facets' selections.
+
+        The facet's own selection is ignored, so the counts show what picking
+        each option would yield.
+        """
+        base = self.bitset(selections, exclude=column)
+        return {
+            value: _popcount(base & bits)
+            for value, bits in self._bitmaps[column].items()
+        }
+
+
+def selection_key(selections):
+    """Order-insensitive, hashable form of a facet selection."""
+    return tuple(
+        (column, tuple(sorted(values)))
+        for column, values in sorted(selections.items())
+        if values
+    )
+
+
+# -------------------------
+# RESULT CACHE
+# -------------------------
+class FilterCache:
+    """Small LRU of filter results, meant to live in one session's state."""
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key, compute):
+        if key in self._results:
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        result = compute()
+        self._results[key] = result
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+        return result
+
+
+# -------------------------
+# ORDER FILTERING
+# -------------------------
+def order_facets(data):
+    return data.derive(
+        "order_facets",
+        lambda d: FacetBitmaps(d["orders"], ORDER_FACETS)
+    )
+
+
+def filtered_positions(data, selections, cache):
+    """Row positions of the orders matching ``selections``.
+
+    Results are cached per (data version, selection), so re-applying or
+    revisiting a filter is a dict hit.
+    """
+    key = (data.version, selection_key(selections))
+    with instrumentation.measure("filter.orders") as span:
+        positions = cache.get(
+            key,
+            lambda: order_facets(data).positions(selections)
+        )
+        span.rows = len(positions)
+    return positions
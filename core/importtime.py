@@ -0,0 +1,89 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+VIEW_MODULES = [
+    "views.customer_view",
+    "views.leadership_view",
+    "views.operations_view",
+    "views.program_view",
+]
+
+# Cold import time per view module, filled in by app.py on first use. It
+# lives here because Streamlit re-executes app.py on every rerun.
+VIEW_IMPORT_SECONDS = {}
+
+
+# -------------------------
+# IMPORT-TIME REPORT
+# -------------------------
+def _parse(stderr):
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((
+            name.strip(),
+            (len(name) - len(name.lstrip()) - 1) // 2,
+            int(self_us),
+            int(cumulative_us),
+        ))
+    return pd.DataFrame(
+        rows, columns=["Module", "Depth", "Self_us", "Cumulative_us"]
+    )
+
+
+def import_time_report(module):
+    """Per-module import cost of ``module`` from a cold interpreter.
+
+    Runs ``python -X importtime`` in a subprocess, so the numbers are what a
+    fresh server process pays, not what is already cached in this one.
+    Rows are in import order; ``Depth`` is the nesting level.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _parse(result.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Report the cold import cost of the dashboard views."
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=VIEW_MODULES,
+        help="Modules to import (default: every view)",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Slowest modules to list per import (by self time)",
+    )
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        report = import_time_report(module)
+        total_ms = report["Cumulative_us"].iloc[-1] / 1000
+        print(f"{module}: {total_ms:.1f} ms cumulative")
+        print(
+            report.nlargest(args.top, "Self_us")
+            .to_string(index=False)
+        )
+        print()
+
+
+if __name__ == "__main__":
+    main()
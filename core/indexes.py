@@ -0,0 +1,112 @@
+import pandas as pd
+
+from core import derived
+from core.ageing import today_epoch_day
+
+# -------------------------
+# HASH INDEX
+# -------------------------
+class FrameIndex:
+    """Hash index from one column's values to the matching rows of a frame.
+
+    Built in a single grouping pass, after which lookups are dict hits
+    instead of boolean scans over the whole frame.
+    """
+
+    def __init__(self, df, column):
+        self._df = df
+        self._positions = df.groupby(
+            column, sort=False, observed=True, dropna=True
+        ).indices
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+    def keys(self):
+        return self._positions.keys()
+
+    def positions(self, key):
+        return self._positions.get(key, [])
+
+    def rows(self, key):
+        """All rows for ``key``, in frame order (empty frame if none)."""
+        return self._df.iloc[self.positions(key)].copy(deep=False)
+
+    def first(self, key):
+        """First row for ``key`` as a Series, or None."""
+        positions = self.positions(key)
+        if len(positions) == 0:
+            return None
+        return self._df.iloc[positions[0]]
+
+
+class OrderIndex:
+    """Order_ID -> order rows, with ``Order_Ageing_Days`` as of today.
+
+    Order IDs are unique, so a ``pd.Index`` is far cheaper to build than a
+    grouping pass. Ageing depends on the date, so it is read from the ageing
+    profile per lookup and the index itself lives for the data version.
+    """
+
+    def __init__(self, orders_df, ageing):
+        self._df = orders_df
+        self._ids = pd.Index(orders_df["Order_ID"])
+        self._ageing = ageing
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def __len__(self):
+        return len(self._ids)
+
+    def keys(self):
+        return self._ids
+
+    def positions(self, key):
+        positions = self._ids.get_indexer_for([key])
+        return positions[positions >= 0]
+
+    def rows(self, key):
+        positions = self.positions(key)
+        orders_df = self._df.iloc[positions].copy(deep=False)
+        orders_df["Order_Ageing_Days"] = self._ageing.ageing_days_at(
+            positions, today_epoch_day()
+        )
+        return orders_df
+
+    def first(self, key):
+        positions = self.positions(key)
+        if len(positions) == 0:
+            return None
+        order = self._df.iloc[positions[0]].copy()
+        order["Order_Ageing_Days"] = self._ageing.ageing_days_at(
+            positions[:1], today_epoch_day()
+        )[0]
+        return order
+
+
+# -------------------------
+# SHARED INDEXES (ONE PER DATA VERSION)
+# -------------------------
+def orders_by_id(data):
+    return data.derive(
+        ("orders_by_id", data.rag_policy.name),
+        lambda d: OrderIndex(derived.orders_with_rag(d), derived.ageing_profile(d))
+    )
+
+
+def tasks_by_order(data):
+    return data.derive(
+        "tasks_by_order",
+        lambda d: FrameIndex(derived.enriched_tasks(d), "Order_ID")
+    )
+
+
+def tasks_by_assignee(data):
+    return data.derive(
+        "tasks_by_assignee",
+        lambda d: FrameIndex(derived.enriched_tasks(d), "assigned_clean")
+    )
@@ -0,0 +1,205 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque, namedtuple
+from contextlib import contextmanager
+
+import pandas as pd
+
+DEFAULT_MAX_SAMPLES = 5000
+
+ADMIN_LOGINS_ENV = "GOVERNANCE_ADMIN_LOGINS"
+
+PROMETHEUS_PREFIX = "governance"
+
+Sample = namedtuple(
+    "Sample",
+    ["session", "name", "seconds", "rows", "memory_delta", "recorded_at"]
+)
+
+# Numeric sample fields; typed up front so an empty window still aggregates.
+NUMERIC_FIELDS = ["seconds", "rows", "memory_delta", "recorded_at"]
+
+# Session of the rerun running on this thread (set by app.py per rerun)
+_session = contextvars.ContextVar("governance_session", default="-")
+
+
+def set_session(session_id):
+    _session.set(str(session_id))
+
+
+def current_session():
+    return _session.get()
+
+
+def is_admin(login_id):
+    """Whether ``login_id`` is listed in $GOVERNANCE_ADMIN_LOGINS (comma separated)."""
+    admins = os.environ.get(ADMIN_LOGINS_ENV, "")
+    login_id = str(login_id or "").strip().lower()
+    return bool(login_id) and login_id in {
+        admin.strip().lower() for admin in admins.split(",") if admin.strip()
+    }
+
+
+def _rss_bytes():
+    # Current resident set size; /proc is cheap, unlike tracemalloc.
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def row_count(value):
+    """Rows in a frame or series result, else None."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    return None
+
+
+# -------------------------
+# ROLLING STORE
+# -------------------------
+class MetricsStore:
+    """The last ``max_samples`` timings, shared by every session in the process."""
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES):
+        self._samples = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def record(self, sample):
+        with self._lock:
+            self._samples.append(sample)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+
+    def frame(self, session=None):
+        with self._lock:
+            samples = list(self._samples)
+        samples_df = pd.DataFrame(samples, columns=Sample._fields).astype(
+            dict.fromkeys(NUMERIC_FIELDS, "float64")
+        )
+        if session is not None:
+            samples_df = samples_df[samples_df["session"] == session]
+        return samples_df
+
+    def summary(self, session=None):
+        """Count, mean/p95/max wall time, rows and memory delta per hook."""
+        samples_df = self.frame(session)
+        seconds = samples_df.groupby("name")["seconds"]
+
+        return pd.DataFrame({
+            "count": seconds.size(),
+            "total_seconds": seconds.sum(),
+            "mean_seconds": seconds.mean(),
+            "p95_seconds": seconds.quantile(0.95),
+            "max_seconds": seconds.max(),
+            "mean_rows": samples_df.groupby("name")["rows"].mean(),
+            "mean_memory_delta": samples_df.groupby("name")["memory_delta"].mean(),
+        }).sort_values("total_seconds", ascending=False)
+
+    # -------------------------
+    # EXPORT
+    # -------------------------
+    def to_json(self):
+        samples_df = self.frame()
+        return json.dumps(
+            {
+                "samples": len(samples_df),
+                "summary": json.loads(
+                    self.summary().reset_index().to_json(orient="records")
+                ),
+            },
+            indent=2,
+        )
+
+    def to_prometheus(self):
+        """Prometheus text exposition of the per-hook summary.
+
+        Values cover the rolling window, so every metric is a gauge.
+        """
+        summary = self.summary()
+        lines = []
+
+        metrics = [
+            ("hook_calls", "count", "gauge", "Instrumented calls in the window"),
+            ("hook_seconds_total", "total_seconds", "gauge", "Wall time in the window"),
+            ("hook_seconds_p95", "p95_seconds", "gauge", "95th percentile wall time"),
+            ("hook_seconds_max", "max_seconds", "gauge", "Slowest call"),
+            ("hook_rows_mean", "mean_rows", "gauge", "Mean rows processed"),
+            ("hook_memory_delta_bytes_mean", "mean_memory_delta", "gauge", "Mean RSS change"),
+        ]
+
+        for metric, column, kind, help_text in metrics:
+            name = f"{PROMETHEUS_PREFIX}_{metric}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for hook, value in summary[column].items():
+                if pd.isna(value):
+                    continue
+                label = str(hook).replace("\\", "\\\\").replace('"', '\\"')
+                lines.append(f'{name}{{hook="{label}"}} {value:g}')
+
+        return "\n".join(lines) + "\n"
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_metrics_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = MetricsStore()
+        return _store
+
+
+# -------------------------
+# HOOKS
+# -------------------------
+class Span:
+    """An in-flight measurement; set ``rows`` to record rows processed."""
+
+    __slots__ = ("name", "rows")
+
+    def __init__(self, name, rows=None):
+        self.name = name
+        self.rows = rows
+
+
+@contextmanager
+def measure(name, rows=None, store=None):
+    """Record wall time, rows and RSS change of the ``with`` block.
+
+    RSS is process-wide: other sessions running concurrently show up in
+    ``memory_delta`` too, even though the sample is tagged with this session.
+    """
+    span = Span(name, rows)
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+    try:
+        yield span
+    finally:
+        seconds = time.perf_counter() - started
+        rss_after = _rss_bytes()
+        memory_delta = None
+        if rss_before is not None and rss_after is not None:
+            memory_delta = rss_after - rss_before
+
+        (store if store is not None else get_metrics_store()).record(Sample(
+            current_session(),
+            span.name,
+            seconds,
+            span.rows,
+            memory_delta,
+            time.time(),
+        ))
+
@@ -0,0 +1,103 @@
+import pandas as pd
+
+CUBE_DIMENSIONS = [
+    "Derived_RAG",
+    "Overall_RAG",
+    "sla_breached",
+    "Lifecycle_Stage",
+    "Order_Type",
+    "Order_Start_Date",
+]
+
+
+# -------------------------
+# KPI CUBE
+# -------------------------
+class KpiCube:
+    """Order counts pre-aggregated over the KPI dimensions.
+
+    Built once per data version from the prepared orders. The tiles and
+    charts the dashboards show are rolled up at build time, so reading them
+    is O(1) no matter how many orders there are. ``rollup`` covers ad-hoc
+    slices over any subset of dimensions.
+    """
+
+    def __init__(self, orders_df):
+        dims = [d for d in CUBE_DIMENSIONS if d in orders_df.columns]
+
+        self.cells = (
+            orders_df[dims]
+            .groupby(dims, observed=True, dropna=False)
+            .size()
+            .rename("Order_Count")
+            .reset_index()
+        )
+        self.dimensions = dims
+
+        # -------------------------
+        # HEADLINE TILES
+        # -------------------------
+        self.total_orders = int(self.cells["Order_Count"].sum())
+        self.breached_orders = self._count(self.cells["sla_breached"])
+        self.amber_orders = self._count(self.cells["Overall_RAG"] == "Amber")
+
+        # -------------------------
+        # DISTRIBUTIONS
+        # -------------------------
+        self.rag_distribution = (
+            self.rollup(["Derived_RAG"])
+            .sort_values(ascending=False)
+        )
+        self.breaches_by_stage = self.rollup(
+            ["Lifecycle_Stage"], where=self.cells["sla_breached"]
+        ).sort_index()
+
+        by_date = self.cells.dropna(subset=["Order_Start_Date"])
+        self._orders_by_date = by_date.groupby("Order_Start_Date")["Order_Count"].sum()
+        self._breaches_by_date = (
+            by_date[by_date["sla_breached"]]
+            .groupby("Order_Start_Date")["Order_Count"]
+            .sum()
+            .reindex(self._orders_by_date.index, fill_value=0)
+        )
+
+    def _count(self, mask):
+        return int(self.cells.loc[mask.astype(bool), "Order_Count"].sum())
+
+    def rollup(self, dims, where=None):
+        """Order counts by ``dims``, optionally restricted to a cell mask."""
+        cells = self.cells if where is None else self.cells[where.astype(bool)]
+        counts = cells.groupby(dims, observed=True)["Order_Count"].sum()
+        return counts[counts > 0]
+
+    # -------------------------
+    # DERIVED TILES
+    # -------------------------
+    @property
+    def breach_pct(self):
+        if not self.total_orders:
+            return 0
+        return round((self.breached_orders / self.total_orders) * 100, 1)
+
+    def count_for(self, series, key):
+        return int(series.get(key, 0))
+
+    # -------------------------
+    # TRENDS
+    # -------------------------
+    def sla_breach_trend(self):
+        """Share of orders breaching SLA, by Order_Start_Date."""
+        return (self._breaches_by_date / self._orders_by_date).rename("SLA_Breach")
+
+    def ageing_trend(self, today):
+        """Ageing in days of the orders started on each date."""
+        start_days = (
+            self._orders_by_date.index
+            .to_numpy(dtype="datetime64[D]")
+            .astype("int64")
+        )
+        return pd.Series(
+            today - start_days,
+            index=self._orders_by_date.index,
+            name="Order_Ageing_Days"
+        )
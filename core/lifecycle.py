@@ -0,0 +1,51 @@
+# -------------------------
+# LIFECYCLE TASK SEQUENCE
+# -------------------------
+SEQUENCE_COLUMNS = [
+    "Next_Task_ID",
+    "Next_Task_Name",
+    "Previous_Task_ID",
+    "Previous_Task_Name",
+]
+
+
+def build_task_sequence(dict_df):
+    """Next/previous task for every dictionary task within its lifecycle.
+
+    Tasks are ordered by Task_ID inside each Lifecycle_Stage, matching the
+    order the operations inbox has always used. Returns one row per
+    (Lifecycle_Stage, Task_ID); the last task of a stage has no next task.
+    A pair listed twice in the dictionary keeps its first row.
+    """
+    sequence = (
+        dict_df[["Lifecycle_Stage", "Task_ID", "Task_Name"]]
+        .drop_duplicates(["Lifecycle_Stage", "Task_ID"])
+        .sort_values(["Lifecycle_Stage", "Task_ID"])
+        .reset_index(drop=True)
+    )
+
+    by_stage = sequence.groupby("Lifecycle_Stage", observed=True, sort=False)
+
+    sequence["Next_Task_ID"] = by_stage["Task_ID"].shift(-1)
+    sequence["Next_Task_Name"] = by_stage["Task_Name"].shift(-1)
+    sequence["Previous_Task_ID"] = by_stage["Task_ID"].shift(1)
+    sequence["Previous_Task_Name"] = by_stage["Task_Name"].shift(1)
+
+    return sequence.drop(columns="Task_Name")
+
+
+def with_task_sequence(tasks_df, sequence):
+    """Join next/previous task columns onto execution rows in one pass.
+
+    ``in_task_sequence`` is False when the task's (Lifecycle_Stage, Task_ID)
+    pair is not in the dictionary at all, as opposed to being the final task.
+    """
+    joined = tasks_df.merge(
+        sequence,
+        on=["Lifecycle_Stage", "Task_ID"],
+        how="left",
+        indicator=True
+    )
+    joined["in_task_sequence"] = joined.pop("_merge") == "both"
+    joined.index = tasks_df.index
+    return joined
@@ -0,0 +1,197 @@
+import logging
+import threading
+from collections import namedtuple
+from pathlib import Path
+
+import pandas as pd
+
+from core import instrumentation, rag, schema, snapshot
+from core.credentials import SECRET_COLUMNS, CredentialStore
+from core.workbook import file_digest, read_workbook
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# SHARED DATA BUNDLE
+# -------------------------
+_MISSING = object()
+
+
+def _share(value):
+    # Shallow copy-on-write copies cost O(columns), not O(rows).
+    if isinstance(value, pd.DataFrame):
+        return value.copy(deep=False)
+    return value
+
+
+class GovernanceData(dict):
+    """Workbook frames for one data version, shared by every session.
+
+    Item access hands out shallow copy-on-write copies, so a view can add
+    columns or assign into its frame without touching the cached one.
+    Anything derived from the frames is built once per version via
+    ``derive`` and shared the same way. ``rag_policy`` selects the rules
+    behind ``Derived_RAG``.
+    """
+
+    def __init__(self, frames, version, load_report=None, credentials=None,
+                 rag_policy=None):
+        super().__init__(frames)
+        self.version = version
+        self.load_report = load_report or {}
+        self.credentials = credentials
+        self.rag_policy = rag_policy or rag.DEFAULT_RAG_POLICY
+        self._derived = {}
+        # Newest day built per day-keyed name
+        self._days = {}
+        # One lock per key, held only while that key is built
+        self._build_locks = {}
+        self._locks_lock = threading.Lock()
+
+    def __getitem__(self, key):
+        return _share(super().__getitem__(key))
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def derive(self, name, builder, day=None):
+        """Return ``builder(self)``, computed once per data version.
+
+        Pass ``day`` for values that depend on today's date: they are built
+        once per day and the previous day's entry is dropped.
+        """
+        key = name if day is None else (name, day)
+
+        # Cache hits take no lock, so a long build never stalls readers.
+        value = self._derived.get(key, _MISSING)
+        if value is not _MISSING:
+            return _share(value)
+
+        with self._locks_lock:
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            value = self._derived.get(key, _MISSING)
+            if value is _MISSING:
+                hook = name[0] if isinstance(name, tuple) else name
+                with instrumentation.measure(f"derive.{hook}") as span:
+                    value = builder(self)
+                    span.rows = instrumentation.row_count(value)
+                self._store(name, key, day, value)
+
+        return _share(value)
+
+    def _store(self, name, key, day, value):
+        with self._locks_lock:
+            if day is None:
+                self._derived[key] = value
+                return
+
+            newest = self._days.get(name)
+            if newest is not None and day < newest:
+                # A rerun that started before midnight; don't cache it.
+                self._build_locks.pop(key, None)
+                return
+            if newest is not None and day > newest:
+                self._derived.pop((name, newest), None)
+                self._build_locks.pop((name, newest), None)
+
+            self._days[name] = day
+            self._derived[key] = value
+
+
+PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+
+def _enable_copy_on_write():
+    # Always on from pandas 3, where the option is deprecated and reading it
+    # warns; opt in explicitly on older releases only.
+    if PANDAS_MAJOR < 3 and not pd.options.mode.copy_on_write:
+        pd.options.mode.copy_on_write = True
+
+
+# -------------------------
+# FILE FINGERPRINT
+# -------------------------
+def file_stat_key(path):
+    stat = Path(path).stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+# -------------------------
+# SOURCE SELECTION
+# -------------------------
+def read_frames(path, snapshot_dir=None, digest=None):
+    """Read from the columnar snapshot when it was built from this workbook."""
+    snapshot_dir = snapshot_dir or snapshot.default_snapshot_dir(path)
+
+    if snapshot.is_fresh(snapshot_dir, path, digest):
+        try:
+            return snapshot.read_snapshot(snapshot_dir)
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable snapshot %s: %s", snapshot_dir, exc)
+
+    frames, report = read_workbook(path)
+    return schema.normalize(frames), report
+
+
+def build_data(frames, version, load_report=None):
+    """Wrap normalized frames into a GovernanceData bundle.
+
+    Passwords are hashed into the credential store and dropped from the
+    shared login frame.
+    """
+    with instrumentation.measure("load.credentials") as span:
+        credentials = CredentialStore(frames["login"])
+        span.rows = len(frames["login"])
+
+    frames["login"] = frames["login"].drop(columns=SECRET_COLUMNS)
+
+    return GovernanceData(
+        frames,
+        version=version,
+        load_report=load_report,
+        credentials=credentials,
+        rag_policy=rag.configured_rag_policy()
+    )
+
+
+# -------------------------
+# PROCESS-WIDE CACHE
+# -------------------------
+_CacheEntry = namedtuple("_CacheEntry", ["stat_key", "digest", "data"])
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def load_workbook_data(path, snapshot_dir=None):
+    """Return the parsed workbook, re-reading it only when the file changes.
+
+    The mtime/size pair is checked on every call; the content hash is only
+    computed when that pair moves, so a touched-but-unchanged file keeps the
+    cached frames.
+    """
+    path = Path(path).resolve()
+    stat_key = file_stat_key(path)
+
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is not None and entry.stat_key == stat_key:
+            return entry.data
+
+        digest = file_digest(path)
+        if entry is not None and entry.digest == digest:
+            _cache[path] = entry._replace(stat_key=stat_key)
+            return entry.data
+
+        _enable_copy_on_write()
+        frames, report = read_frames(path, snapshot_dir, digest)
+        data = build_data(frames, digest[:12], report)
+        _cache[path] = _CacheEntry(stat_key, digest, data)
+        return data
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
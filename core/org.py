@@ -0,0 +1,73 @@
+import threading
+
+
+# -------------------------
+# ORG HIERARCHY
+# -------------------------
+class OrgGraph:
+    """Manager -> reportee graph from the Login_Credentials sheet.
+
+    Built once per data version from the normalized login, name and
+    "Reports to" keys. Direct reportees are a dict lookup; the full
+    (skip-level) tree under a manager is expanded once and then cached.
+    All logins and names are in their normalized (stripped, lower-case) form.
+    """
+
+    def __init__(self, login_df):
+        self._names = {}
+        self._direct = {}
+
+        for login, name, manager in zip(
+            login_df["login_clean"],
+            login_df["poc_clean"],
+            login_df["reports_to_clean"],
+        ):
+            # A duplicated Login_ID keeps its first row's name.
+            self._names.setdefault(login, name)
+            # Dicts keep insertion order and drop repeated logins.
+            self._direct.setdefault(manager, {})[login] = None
+
+        self._tree = {}
+        self._tree_lock = threading.Lock()
+
+    def __contains__(self, login):
+        return login in self._names
+
+    def name_of(self, login):
+        return self._names.get(login)
+
+    def direct_reportees(self, login):
+        """Logins reporting straight to ``login``, in sheet order."""
+        name = self._names.get(login)
+        if name is None:
+            return []
+        return list(self._direct.get(name, []))
+
+    def all_reportees(self, login):
+        """Every login below ``login``, breadth first (skip levels included)."""
+        with self._tree_lock:
+            if login not in self._tree:
+                self._tree[login] = self._expand(login)
+            return list(self._tree[login])
+
+    def _expand(self, login):
+        seen = {login}
+        found = []
+        frontier = [login]
+
+        while frontier:
+            next_frontier = []
+            for manager in frontier:
+                for reportee in self.direct_reportees(manager):
+                    # Guard against cycles in "Reports to".
+                    if reportee not in seen:
+                        seen.add(reportee)
+                        found.append(reportee)
+                        next_frontier.append(reportee)
+            frontier = next_frontier
+
+        return found
+
+
+def org_graph(data):
+    return data.derive("org_graph", lambda d: OrgGraph(d["login"]))
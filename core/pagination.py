@@ -0,0 +1,26 @@
+import math
+from collections import namedtuple
+
+DEFAULT_PAGE_SIZE = 10
+
+Page = namedtuple("Page", ["number", "size", "total"])
+
+
+def page_count(total, size=DEFAULT_PAGE_SIZE):
+    return max(1, math.ceil(total / size))
+
+
+def make_page(total, number=1, size=DEFAULT_PAGE_SIZE):
+    """A 1-based page, clamped into range for ``total`` rows."""
+    number = min(max(1, int(number)), page_count(total, size))
+    return Page(number=number, size=size, total=total)
+
+
+def page_offset(page):
+    return (page.number - 1) * page.size
+
+
+def page_slice(df, page):
+    """Rows of ``df`` on ``page`` (positional, no copy of the other rows)."""
+    start = page_offset(page)
+    return df.iloc[start:start + page.size]
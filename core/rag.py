@@ -0,0 +1,76 @@
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+RAG_LEVELS = ["Green", "Amber", "Red"]
+
+RAG_POLICY_ENV = "GOVERNANCE_RAG_POLICY"
+
+# -------------------------
+# RAG POLICIES
+# -------------------------
+# rules: ordered (label, condition) pairs, first match wins. A condition
+# takes the orders frame and returns a boolean mask over all rows.
+RagPolicy = namedtuple("RagPolicy", ["name", "rules", "default"])
+
+SLA_FIRST_POLICY = RagPolicy(
+    name="sla_first",
+    rules=[
+        ("Red", lambda df: df["sla_breached"]),
+        ("Amber", lambda df: df["Overall_RAG"] == "Amber"),
+    ],
+    default="Green",
+)
+
+# The RAG captured in the workbook, as entered.
+WORKBOOK_POLICY = RagPolicy(
+    name="workbook",
+    rules=[
+        ("Red", lambda df: df["Overall_RAG"] == "Red"),
+        ("Amber", lambda df: df["Overall_RAG"] == "Amber"),
+    ],
+    default="Green",
+)
+
+DEFAULT_RAG_POLICY = SLA_FIRST_POLICY
+
+RAG_POLICIES = {
+    policy.name: policy for policy in [SLA_FIRST_POLICY, WORKBOOK_POLICY]
+}
+
+
+def register_rag_policy(policy):
+    """Make ``policy`` selectable by name."""
+    RAG_POLICIES[policy.name] = policy
+
+
+def configured_rag_policy():
+    """The policy named by $GOVERNANCE_RAG_POLICY (default: sla_first)."""
+    name = os.environ.get(RAG_POLICY_ENV)
+    if not name:
+        return DEFAULT_RAG_POLICY
+    try:
+        return RAG_POLICIES[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown RAG policy {name!r}; expected one of {sorted(RAG_POLICIES)}"
+        ) from None
+
+
+def derive_rag(orders_df, policy=DEFAULT_RAG_POLICY):
+    """Evaluate a RAG policy over the whole frame in one vectorized pass."""
+    labels = [label for label, _ in policy.rules]
+    conditions = [
+        np.asarray(condition(orders_df), dtype=bool)
+        for _, condition in policy.rules
+    ]
+
+    values = np.select(conditions, labels, default=policy.default)
+
+    extra = [
+        label for label in dict.fromkeys(labels + [policy.default])
+        if label not in RAG_LEVELS
+    ]
+    return pd.Categorical(values, categories=RAG_LEVELS + extra)
@@ -0,0 +1,131 @@
+import pandas as pd
+
+# Bump when normalize() output changes, so stale snapshots are rebuilt.
+SCHEMA_VERSION = 2
+
+# -------------------------
+# COLUMN TYPES PER SHEET
+# -------------------------
+DATE_COLUMNS = {
+    "orders": ["Order_Start_Date"],
+    "tasks": ["Task_Start_Date"],
+}
+
+CATEGORY_COLUMNS = {
+    "orders": [
+        "Customer Type",
+        "Order_Type",
+        "Circle/Region",
+        "Lifecycle_Stage",
+        "Order_Status",
+        "Overall_RAG",
+        "SLA_Breach_Flag",
+    ],
+    "tasks": [
+        "Lifecycle_Stage",
+        "Assigned_To_Team",
+        "Task_Status",
+        "Reassignment_Requested",
+        "Escalation_Triggered",
+    ],
+    "dictionary": [
+        "Lifecycle_Stage",
+        "Input_Type",
+        "Default_Task_Owner",
+        "Escalation Type",
+        "Hold_Applicable (Y/N)",
+        "Customer_Visible (Y/N)",
+        "Active_Flag (Y/N)",
+    ],
+    "holds": ["Lifecycle_Stage", "Category"],
+    "escalations": [
+        "Lifecycle_Stage",
+        "Escalation_Level",
+        "Escalated_Team",
+        "Escalation_Role",
+    ],
+    "login": ["Type", "Designation", "Team_Name", "Active_Flag"],
+}
+
+# Boolean column -> (source column, value meaning True)
+FLAG_COLUMNS = {
+    "orders": {"sla_breached": ("SLA_Breach_Flag", "Yes")},
+    "tasks": {
+        "reassignment_requested": ("Reassignment_Requested", "Yes"),
+        "escalation_triggered": ("Escalation_Triggered", "Yes"),
+        "on_hold": ("Hold_Reason_Code", None),
+    },
+    "dictionary": {
+        "hold_applicable": ("Hold_Applicable (Y/N)", "Y"),
+        "customer_visible": ("Customer_Visible (Y/N)", "Y"),
+        "is_active": ("Active_Flag (Y/N)", "Y"),
+    },
+    "login": {"is_active": ("Active_Flag", "Y")},
+}
+
+# Lower-cased, stripped match key -> source column
+KEY_COLUMNS = {
+    "tasks": {
+        "assigned_clean": "Assigned_To_POC",
+        "status_clean": "Task_Status",
+    },
+    "login": {
+        "login_clean": "Login_ID",
+        "poc_clean": "POC_Name",
+        "reports_to_clean": "Reports to",
+    },
+}
+
+# Key columns with few distinct values are stored as categoricals.
+CATEGORY_KEY_COLUMNS = {"status_clean"}
+
+
+def clean_key(values):
+    """Normalize a column for matching: text, stripped, lower-cased."""
+    return values.astype(str).str.strip().str.lower()
+
+
+# -------------------------
+# NORMALIZE
+# -------------------------
+def _normalize_frame(key, df):
+    df = df.copy(deep=False)
+    # Sheet headers carry stray whitespace (e.g. "Input_Type ").
+    df.columns = [
+        col.strip() if isinstance(col, str) else col for col in df.columns
+    ]
+
+    for col in DATE_COLUMNS.get(key, []):
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
+
+    for flag_col, (source_col, true_value) in FLAG_COLUMNS.get(key, {}).items():
+        if source_col not in df.columns:
+            continue
+        if true_value is None:
+            df[flag_col] = df[source_col].notna()
+        else:
+            df[flag_col] = (df[source_col].astype(object) == true_value).astype(bool)
+
+    for key_col, source_col in KEY_COLUMNS.get(key, {}).items():
+        if source_col not in df.columns:
+            continue
+        df[key_col] = clean_key(df[source_col])
+        if key_col in CATEGORY_KEY_COLUMNS:
+            df[key_col] = df[key_col].astype("category")
+
+    for col in CATEGORY_COLUMNS.get(key, []):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+
+    return df
+
+
+def normalize(frames):
+    """Type the raw sheet frames once at load time.
+
+    Dates become datetime64, low-cardinality text becomes categorical, flag
+    columns gain a boolean twin (e.g. ``sla_breached``) and match keys such
+    as ``assigned_clean`` are pre-normalized, so views never redo this work.
+    """
+    return {key: _normalize_frame(key, df) for key, df in frames.items()}
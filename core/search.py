@@ -0,0 +1,164 @@
+import numpy as np
+import pandas as pd
+
+from core import instrumentation
+
+DEFAULT_MATCH_LIMIT = 20
+
+LABEL_SEPARATOR = " | "
+
+
+def _lower(values):
+    return values.astype(str).str.strip().str.lower()
+
+
+def _byte_matrix(texts):
+    """UTF-8 bytes of ``texts`` as an (n, width) uint8 array, zero padded."""
+    encoded = np.array(texts.str.encode("utf-8").tolist(), dtype=bytes)
+    width = max(encoded.dtype.itemsize, 1)
+    return encoded.astype(f"S{width}").view(np.uint8).reshape(len(texts), width)
+
+
+def _trigram_codes(matrix):
+    # Every 3-byte window as one int; windows running into padding are -1.
+    a = matrix[:, :-2].astype(np.int32)
+    b = matrix[:, 1:-1].astype(np.int32)
+    c = matrix[:, 2:].astype(np.int32)
+    codes = (a << 16) | (b << 8) | c
+    return np.where(c == 0, -1, codes)
+
+
+# -------------------------
+# ORDER SEARCH INDEX
+# -------------------------
+class OrderSearchIndex:
+    """Typeahead index over Order_ID and Client_Name.
+
+    Labels are kept sorted, prefix lookups are binary searches over sorted
+    lowercase keys, and substring lookups intersect trigram posting lists
+    built in one vectorized pass. Queries return at most ``limit`` labels,
+    so only the matches ever reach the browser.
+    """
+
+    def __init__(self, orders_df, id_column="Order_ID", name_column="Client_Name"):
+        labels = (
+            orders_df[id_column].astype(str)
+            + LABEL_SEPARATOR
+            + orders_df[name_column].astype(str)
+        )
+        order = np.argsort(labels.to_numpy(dtype=str), kind="stable")
+
+        self.labels = labels.to_numpy(dtype=object)[order]
+        self.order_ids = orders_df[id_column].to_numpy(dtype=object)[order]
+        self._haystack = _lower(pd.Series(self.labels)).tolist()
+
+        # Prefix keys: sorted lowercase values with their label positions
+        self._prefix = []
+        for column in (id_column, name_column):
+            keys = _lower(orders_df[column]).to_numpy(dtype=str)[order]
+            by_key = np.argsort(keys, kind="stable")
+            self._prefix.append((keys[by_key], by_key))
+
+        # Trigram postings: (code, label position) pairs sorted by code
+        codes = _trigram_codes(_byte_matrix(pd.Series(self._haystack)))
+        rows = np.broadcast_to(np.arange(len(codes))[:, None], codes.shape)
+        keep = codes >= 0
+        pairs = np.sort((codes[keep].astype(np.int64) << 32) | rows[keep])
+        pairs = pairs[np.concatenate(([True], pairs[1:] != pairs[:-1]))]
+        self._codes = pairs >> 32
+        self._rows = pairs & 0xFFFFFFFF
+
+    def __len__(self):
+        return len(self.labels)
+
+    def _prefix_matches(self, query):
+        matches = []
+        for keys, positions in self._prefix:
+            start = np.searchsorted(keys, query, side="left")
+            stop = np.searchsorted(keys, query + "\U0010ffff", side="left")
+            matches.append(np.sort(positions[start:stop]))
+        return matches
+
+    def _substring_matches(self, query, limit, exclude=()):
+        codes = np.unique(_trigram_codes(_byte_matrix(pd.Series([query])))[0])
+        codes = codes[codes >= 0]
+
+        # Intersect the rarest trigrams first to keep candidate sets small.
+        bounds = sorted(
+            (np.searchsorted(self._codes, [code, code + 1]) for code in codes),
+            key=lambda bound: bound[1] - bound[0]
+        )
+
+        candidates = None
+        for start, stop in bounds:
+            rows = self._rows[start:stop]
+            candidates = rows if candidates is None else np.intersect1d(
+                candidates, rows, assume_unique=True
+            )
+            if not len(candidates):
+                return []
+
+        if candidates is None:
+            return []
+
+        # Trigrams can match out of order; confirm the substring proper.
+        # Positions already ranked don't count towards the limit.
+        found = []
+        for position in candidates:
+            if position in exclude:
+                continue
+            if query in self._haystack[position]:
+                found.append(position)
+                if len(found) >= limit:
+                    break
+        return found
+
+    def search(self, query, limit=DEFAULT_MATCH_LIMIT):
+        """Up to ``limit`` label positions for ``query``, best matches first.
+
+        Order_ID prefixes rank first, then customer-name prefixes, then (for
+        queries of three or more characters) matches anywhere in the label.
+        An empty query returns the first labels in sorted order.
+        """
+        query = str(query).strip().lower()
+        if not query:
+            return list(range(min(limit, len(self.labels))))
+
+        ranked = []
+        seen = set()
+
+        def take(group):
+            for position in group:
+                position = int(position)
+                if position not in seen:
+                    seen.add(position)
+                    ranked.append(position)
+                    if len(ranked) >= limit:
+                        return True
+            return False
+
+        for group in self._prefix_matches(query):
+            if take(group):
+                return ranked
+
+        if len(query.encode("utf-8")) >= 3:
+            take(self._substring_matches(query, limit - len(ranked), seen))
+
+        return ranked
+
+    def matches(self, query, limit=DEFAULT_MATCH_LIMIT):
+        """(Order_ID, label) pairs for the top matches of ``query``."""
+        with instrumentation.measure("search.orders") as span:
+            positions = self.search(query, limit)
+            span.rows = len(positions)
+        return [
+            (self.order_ids[position], self.labels[position])
+            for position in positions
+        ]
+
+
+def order_search(data):
+    return data.derive(
+        "order_search",
+        lambda d: OrderSearchIndex(d["orders"])
+    )
@@ -0,0 +1,159 @@
+import argparse
+import os
+import time
+from pathlib import Path
+
+from core import schema
+from core.workbook import SHEETS, file_digest, read_workbook
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pa_ipc = None
+
+SNAPSHOT_SUFFIX = ".arrow"
+SCHEMA_VERSION_KEY = b"governance.schema_version"
+WORKBOOK_DIGEST_KEY = b"governance.workbook_digest"
+
+
+def snapshot_available():
+    return pa is not None
+
+
+# -------------------------
+# PATHS
+# -------------------------
+def default_snapshot_dir(workbook_path):
+    workbook_path = Path(workbook_path)
+    return workbook_path.with_name(workbook_path.stem + ".snapshot")
+
+
+def _sheet_path(snapshot_dir, key):
+    return Path(snapshot_dir) / f"{key}{SNAPSHOT_SUFFIX}"
+
+
+def is_fresh(snapshot_dir, workbook_path, digest=None):
+    """True when every sheet file exists and was built from this workbook.
+
+    Each sheet file records the sha256 of the workbook it was compiled from;
+    pass ``digest`` when the caller has already hashed the workbook.
+    """
+    if not snapshot_available():
+        return False
+
+    digest = digest or file_digest(workbook_path)
+
+    for key in SHEETS:
+        sheet_path = _sheet_path(snapshot_dir, key)
+        if not sheet_path.exists():
+            return False
+
+        # Only the schema is read; the table stays on disk.
+        with pa.memory_map(str(sheet_path), "r") as source:
+            metadata = pa_ipc.open_file(source).schema.metadata or {}
+        if metadata.get(WORKBOOK_DIGEST_KEY, b"").decode() != digest:
+            return False
+
+    return True
+
+
+# -------------------------
+# BUILD
+# -------------------------
+def write_snapshot(frames, snapshot_dir, workbook_digest=None):
+    if not snapshot_available():
+        raise RuntimeError("pyarrow is required to write a columnar snapshot")
+
+    snapshot_dir = Path(snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+    for key, df in frames.items():
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[SCHEMA_VERSION_KEY] = str(schema.SCHEMA_VERSION).encode()
+        if workbook_digest is not None:
+            metadata[WORKBOOK_DIGEST_KEY] = workbook_digest.encode()
+        table = table.replace_schema_metadata(metadata)
+
+        # Write beside the target and swap in, so readers never see a
+        # half-written file.
+        sheet_path = _sheet_path(snapshot_dir, key)
+        tmp_path = sheet_path.with_suffix(sheet_path.suffix + ".tmp")
+        with pa_ipc.new_file(str(tmp_path), table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, sheet_path)
+
+
+def build_snapshot(workbook_path, snapshot_dir=None):
+    snapshot_dir = snapshot_dir or default_snapshot_dir(workbook_path)
+    frames, report = read_workbook(workbook_path)
+    write_snapshot(
+        schema.normalize(frames), snapshot_dir, file_digest(workbook_path)
+    )
+    return snapshot_dir, report
+
+
+# -------------------------
+# RUNTIME READ
+# -------------------------
+def read_snapshot(snapshot_dir):
+    """Memory-map each sheet file and return frames plus a timing report."""
+    frames = {}
+    report = {"source": "snapshot", "sheets": {}}
+    started = time.perf_counter()
+
+    for key, sheet_name in SHEETS.items():
+        sheet_started = time.perf_counter()
+
+        with pa.memory_map(str(_sheet_path(snapshot_dir, key)), "r") as source:
+            table = pa_ipc.open_file(source).read_all()
+
+        metadata = table.schema.metadata or {}
+        version = metadata.get(SCHEMA_VERSION_KEY, b"").decode()
+        if version != str(schema.SCHEMA_VERSION):
+            raise ValueError(
+                f"snapshot schema version {version or 'unknown'} does not match "
+                f"{schema.SCHEMA_VERSION}; rebuild it"
+            )
+
+        frames[key] = table.to_pandas()
+
+        report["sheets"][sheet_name] = {
+            "seconds": time.perf_counter() - sheet_started,
+            "rows": len(frames[key]),
+        }
+
+    report["total_seconds"] = time.perf_counter() - started
+    return frames, report
+
+
+# -------------------------
+# CLI
+# -------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compile the governance workbook into a columnar snapshot."
+    )
+    parser.add_argument(
+        "workbook",
+        nargs="?",
+        default="Delivery_governance_data.xlsx",
+        help="Path to the governance workbook",
+    )
+    parser.add_argument(
+        "--out",
+        help="Snapshot directory (default: <workbook>.snapshot next to the workbook)",
+    )
+    args = parser.parse_args(argv)
+
+    snapshot_dir, report = build_snapshot(args.workbook, args.out)
+
+    for sheet_name, stats in report["sheets"].items():
+        print(f"{sheet_name}: {stats['rows']} rows")
+    print(f"Snapshot written to {snapshot_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from core import instrumentation
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent / "tickets.db"
+DB_PATH_ENV = "GOVERNANCE_TICKETS_DB"
+
+DEFAULT_AUTO_CLOSE_AFTER = pd.Timedelta(hours=2)
+AUTO_CLOSE_ENV = "GOVERNANCE_TICKET_AUTO_CLOSE_HOURS"
+
+TICKET_COLUMNS = [
+    "Ticket_ID",
+    "Order_ID",
+    "Task_ID",
+    "Lifecycle_Stage",
+    "Assigned_To_Team",
+    "Assigned_To_POC",
+    "Customer_Name",
+    "Category",
+    "Description",
+    "Status",
+    "Status_Updated_On",
+    "Customer_Notified",
+    "Raised_On",
+    "Version",
+]
+
+TIMESTAMP_COLUMNS = ["Status_Updated_On", "Raised_On"]
+
+# -------------------------
+# TICKET LIFECYCLE
+# -------------------------
+# Status -> statuses it may move to next
+TICKET_TRANSITIONS = {
+    "Open": {"Acknowledged"},
+    "Acknowledged": {"In Progress"},
+    "In Progress": {"Resolved"},
+    "Resolved": {"Closed"},
+    "Closed": set(),
+}
+
+
+class TicketError(Exception):
+    pass
+
+
+class InvalidTransitionError(TicketError):
+    pass
+
+
+class TicketConflictError(TicketError):
+    """The ticket changed since the caller read it (or no longer exists)."""
+
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    Ticket_ID TEXT PRIMARY KEY,
+    Order_ID TEXT NOT NULL,
+    Task_ID TEXT,
+    Lifecycle_Stage TEXT,
+    Assigned_To_Team TEXT,
+    Assigned_To_POC TEXT,
+    Customer_Name TEXT,
+    Category TEXT,
+    Description TEXT,
+    Status TEXT NOT NULL,
+    Status_Updated_On TEXT NOT NULL,
+    Customer_Notified INTEGER NOT NULL DEFAULT 0,
+    Raised_On TEXT NOT NULL,
+    Version INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS ticket_sequence (
+    day TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tickets_order ON tickets (Order_ID);
+CREATE INDEX IF NOT EXISTS idx_tickets_assignee
+    ON tickets (lower(trim(Assigned_To_POC)));
+CREATE INDEX IF NOT EXISTS idx_tickets_status
+    ON tickets (Status, Status_Updated_On);
+"""
+
+
+def _allocate_ticket_id(conn, now):
+    # Runs inside the insert's write transaction, so the per-day counter is
+    # serialized across sessions and processes. IDs look like
+    # TCKT_20250901_000042 and sort in creation order.
+    day = now.strftime("%Y%m%d")
+    conn.execute(
+        "INSERT INTO ticket_sequence (day, value) VALUES (?, 1) "
+        "ON CONFLICT (day) DO UPDATE SET value = value + 1",
+        [day]
+    )
+    (seq,) = conn.execute(
+        "SELECT value FROM ticket_sequence WHERE day = ?", [day]
+    ).fetchone()
+    return f"TCKT_{day}_{seq:06d}"
+
+
+def _to_db(column, value):
+    if value is None:
+        return None
+    if column in TIMESTAMP_COLUMNS:
+        return pd.Timestamp(value).strftime(TIMESTAMP_FORMAT)
+    if column == "Customer_Notified":
+        return int(bool(value))
+    if column == "Version":
+        return int(value)
+    return str(value)
+
+
+def _to_frame(rows):
+    tickets_df = pd.DataFrame([tuple(row) for row in rows], columns=TICKET_COLUMNS)
+    for col in TIMESTAMP_COLUMNS:
+        tickets_df[col] = pd.to_datetime(tickets_df[col], format=TIMESTAMP_FORMAT)
+    tickets_df["Customer_Notified"] = tickets_df["Customer_Notified"].astype(bool)
+    return tickets_df
+
+
+# -------------------------
+# TICKET STORE
+# -------------------------
+class TicketStore:
+    """Customer tickets in SQLite, shared by every session and process.
+
+    The database runs in WAL mode so readers never block the writer, and
+    each thread (Streamlit session) gets its own connection.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=10000")
+            self._local.conn = conn
+        return conn
+
+    def _write(self):
+        return _Transaction(self._conn())
+
+    # -------------------------
+    # WRITES
+    # -------------------------
+    def create_ticket(self, ticket):
+        """Insert a new ticket and return its allocated Ticket_ID."""
+        with self._write() as conn:
+            # Stamped under the write lock, so Raised_On follows ID order.
+            now = pd.Timestamp.now()
+            ticket_id = _allocate_ticket_id(conn, now)
+
+            record = {
+                "Status": "Open",
+                "Customer_Notified": False,
+                **ticket,
+                "Ticket_ID": ticket_id,
+                "Raised_On": now,
+                "Status_Updated_On": now,
+                "Version": 0,
+            }
+            values = [_to_db(col, record.get(col)) for col in TICKET_COLUMNS]
+            conn.execute(
+                f"INSERT INTO tickets ({', '.join(TICKET_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(TICKET_COLUMNS))})",
+                values
+            )
+        return ticket_id
+
+    def _apply(self, ticket_id, expected_version, assignments, guard="", params=()):
+        # Single-row compare-and-set on the primary key: the write only lands
+        # if nobody else has bumped the version since the caller read it.
+        now = pd.Timestamp.now()
+        sets = ", ".join(f"{col} = ?" for col in assignments)
+        values = [_to_db(col, value) for col, value in assignments.items()]
+
+        with self._write() as conn:
+            cursor = conn.execute(
+                f"UPDATE tickets SET {sets}, Status_Updated_On = ?, "
+                "Version = Version + 1 "
+                f"WHERE Ticket_ID = ? AND Version = ? {guard}",
+                values + [
+                    _to_db("Status_Updated_On", now),
+                    ticket_id,
+                    int(expected_version),
+                    *params,
+                ]
+            )
+
+        if cursor.rowcount != 1:
+            raise TicketConflictError(
+                f"Ticket {ticket_id} was changed by someone else; reload and retry."
+            )
+        return int(expected_version) + 1
+
+    def transition(self, ticket_id, from_status, to_status, expected_version):
+        """Move one ticket along its lifecycle; returns the new version."""
+        if to_status not in TICKET_TRANSITIONS.get(from_status, set()):
+            raise InvalidTransitionError(
+                f"Ticket cannot move from {from_status} to {to_status}."
+            )
+
+        assignments = {"Status": to_status}
+        if to_status == "Resolved":
+            assignments["Customer_Notified"] = True
+
+        return self._apply(
+            ticket_id,
+            expected_version,
+            assignments,
+            guard="AND Status = ?",
+            params=(from_status,)
+        )
+
+    def reassign(self, ticket_id, new_assignee, expected_version):
+        return self._apply(
+            ticket_id,
+            expected_version,
+            {"Assigned_To_POC": new_assignee}
+        )
+
+    def close_resolved(self, older_than, now=None):
+        """Close tickets resolved more than ``older_than`` ago."""
+        now = pd.Timestamp.now() if now is None else now
+        cutoff = _to_db("Status_Updated_On", now - older_than)
+
+        with self._write() as conn:
+            cursor = conn.execute(
+                "UPDATE tickets SET Status = 'Closed', Status_Updated_On = ?, "
+                "Version = Version + 1 "
+                "WHERE Status = 'Resolved' AND Status_Updated_On < ?",
+                [_to_db("Status_Updated_On", now), cutoff]
+            )
+        return cursor.rowcount
+
+    # -------------------------
+    # READS
+    # -------------------------
+    def next_resolved_at(self):
+        """Oldest Status_Updated_On among Resolved tickets, or None."""
+        (value,) = self._conn().execute(
+            "SELECT MIN(Status_Updated_On) FROM tickets WHERE Status = 'Resolved'"
+        ).fetchone()
+        return pd.Timestamp(value) if value else None
+
+    def count(self, order_id=None, assignees=None, status=None):
+        where, params = _where(order_id, assignees, status)
+        if where is None:
+            return 0
+
+        (count,) = self._conn().execute(
+            f"SELECT COUNT(*) FROM tickets {where}", params
+        ).fetchone()
+        return count
+
+    def find(
+        self,
+        order_id=None,
+        assignees=None,
+        status=None,
+        newest_first=False,
+        limit=None,
+        offset=0,
+    ):
+        """Tickets matching every given filter, in ID (creation) order.
+
+        ``assignees`` are matched case- and whitespace-insensitively and
+        ``status`` may be one status or a list. ``limit``/``offset`` page
+        through the result in SQL, so only one page is ever materialized.
+        """
+        where, params = _where(order_id, assignees, status)
+        if where is None:
+            return _to_frame([])
+
+        order = "DESC" if newest_first else "ASC"
+        page = ""
+        if limit is not None:
+            page = "LIMIT ? OFFSET ?"
+            params = params + [int(limit), int(offset)]
+
+        with instrumentation.measure("tickets.find") as span:
+            rows = self._conn().execute(
+                f"SELECT {', '.join(TICKET_COLUMNS)} FROM tickets {where} "
+                f"ORDER BY Ticket_ID {order} {page}",
+                params
+            ).fetchall()
+            span.rows = len(rows)
+
+        return _to_frame(rows)
+
+
+def _where(order_id=None, assignees=None, status=None):
+    # Returns (None, None) when a filter can match nothing.
+    clauses = []
+    params = []
+
+    if order_id is not None:
+        clauses.append("Order_ID = ?")
+        params.append(str(order_id))
+
+    if assignees is not None:
+        assignees = [str(a).strip().lower() for a in assignees]
+        if not assignees:
+            return None, None
+        clauses.append(
+            f"lower(trim(Assigned_To_POC)) IN ({', '.join('?' * len(assignees))})"
+        )
+        params.extend(assignees)
+
+    if status is not None:
+        statuses = [status] if isinstance(status, str) else list(status)
+        if not statuses:
+            return None, None
+        clauses.append(f"Status IN ({', '.join('?' * len(statuses))})")
+        params.extend(statuses)
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+class _Transaction:
+    # BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+    # queue on busy_timeout instead of failing mid-transaction.
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+# -------------------------
+# SHARED STORE
+# -------------------------
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_ticket_store(path=None):
+    """Process-wide store for ``path`` (default: $GOVERNANCE_TICKETS_DB or tickets.db)."""
+    path = Path(path or os.environ.get(DB_PATH_ENV) or DEFAULT_DB_PATH).resolve()
+
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = TicketStore(path)
+        return _stores[path]
+
+
+# -------------------------
+# AUTO-CLOSE
+# -------------------------
+def auto_close_window():
+    """How long a Resolved ticket stays open ($GOVERNANCE_TICKET_AUTO_CLOSE_HOURS)."""
+    hours = os.environ.get(AUTO_CLOSE_ENV)
+    if not hours:
+        return DEFAULT_AUTO_CLOSE_AFTER
+    return pd.Timedelta(hours=float(hours))
+
+
+class AutoCloseScheduler(threading.Thread):
+    """Background thread closing Resolved tickets once their window passes.
+
+    It sleeps until the oldest Resolved ticket falls due (read from the
+    status index), capped at ``poll_seconds`` so newly resolved tickets are
+    picked up. Nobody needs to have the operations page open.
+    """
+
+    def __init__(self, store, window, poll_seconds=60):
+        super().__init__(name="ticket-auto-close", daemon=True)
+        self.store = store
+        self.window = window
+        self.poll_seconds = poll_seconds
+        self._stopped = threading.Event()
+
+    def run_once(self, now=None):
+        now = pd.Timestamp.now() if now is None else now
+        closed = self.store.close_resolved(self.window, now=now)
+
+        wait = self.poll_seconds
+        oldest = self.store.next_resolved_at()
+        if oldest is not None:
+            due_in = (oldest + self.window - now).total_seconds()
+            wait = min(wait, max(due_in, 1))
+        return closed, wait
+
+    def run(self):
+        while not self._stopped.is_set():
+            try:
+                _, wait = self.run_once()
+            except sqlite3.Error:
+                wait = self.poll_seconds
+            self._stopped.wait(wait)
+
+    def stop(self):
+        self._stopped.set()
+
+
+_schedulers = {}
+
+
+def start_auto_close(store=None, window=None, poll_seconds=60):
+    """Start (once per store and process) the auto-close background thread."""
+    store = store or get_ticket_store()
+    window = window or auto_close_window()
+
+    with _stores_lock:
+        scheduler = _schedulers.get(store.path)
+        if scheduler is None or not scheduler.is_alive():
+            scheduler = AutoCloseScheduler(store, window, poll_seconds)
+            scheduler.start()
+            _schedulers[store.path] = scheduler
+        return scheduler
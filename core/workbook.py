@@ -0,0 +1,105 @@
+import hashlib
+import logging
+import time
+
+import openpyxl
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+logger = logging.getLogger(__name__)
+
+# -------------------------
+# WORKBOOK LAYOUT
+# -------------------------
+SHEETS = {
+    "orders": "Orders_Master",
+    "tasks": "Order_Task_Execution",
+    "dictionary": "Process_Task_Dictionary",
+    "holds": "Hold_Reason_LOV",
+    "escalations": "Escalation_Matrix",
+    "login": "Login_Credentials",
+}
+
+
+# -------------------------
+# WORKBOOK DIGEST
+# -------------------------
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# -------------------------
+# WORKBOOK READ
+# -------------------------
+def _convert_cell(value):
+    # Same cell coercion pandas' openpyxl reader applies.
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _sheet_rows(worksheet):
+    rows = []
+    last_data_row = 0
+
+    for row in worksheet.iter_rows(values_only=True):
+        cells = [_convert_cell(value) for value in row]
+        while cells and cells[-1] == "":
+            cells.pop()
+        rows.append(cells)
+        if cells:
+            last_data_row = len(rows)
+
+    rows = rows[:last_data_row]
+    width = max(map(len, rows), default=0)
+    return [cells + [""] * (width - len(cells)) for cells in rows]
+
+
+def _frame_from_rows(rows):
+    if not rows:
+        return pd.DataFrame()
+    return TextParser(rows, header=0).read()
+
+
+def read_workbook(path):
+    """Parse all governance sheets from a single open of the workbook.
+
+    Returns the frames (matching ``pd.read_excel`` output per sheet) and a
+    report with the parse time and row count of each sheet.
+    """
+    frames = {}
+    report = {"source": "xlsx", "sheets": {}}
+
+    started = time.perf_counter()
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    report["open_seconds"] = time.perf_counter() - started
+
+    try:
+        for key, sheet_name in SHEETS.items():
+            if sheet_name not in workbook.sheetnames:
+                raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+            sheet_started = time.perf_counter()
+            frames[key] = _frame_from_rows(_sheet_rows(workbook[sheet_name]))
+            report["sheets"][sheet_name] = {
+                "seconds": time.perf_counter() - sheet_started,
+                "rows": len(frames[key]),
+            }
+    finally:
+        workbook.close()
+
+    report["total_seconds"] = time.perf_counter() - started
+
+    for sheet_name, stats in report["sheets"].items():
+        logger.info(
+            "Parsed %s: %d rows in %.3fs",
+            sheet_name, stats["rows"], stats["seconds"]
+        )
+
+    return frames, report
@@ -0,0 +1,51 @@
+import streamlit as st
+
+from core import instrumentation
+from core.pagination import DEFAULT_PAGE_SIZE, make_page, page_count, page_offset
+
+# -------------------------
+# PAGINATION CONTROLS
+# -------------------------
+def page_controls(total, key, size=DEFAULT_PAGE_SIZE):
+    """Render a page picker for ``total`` rows and return the chosen Page."""
+    pages = page_count(total, size)
+
+    # Keep a remembered page in range when the list shrinks.
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+
+    if pages == 1:
+        page = make_page(total, 1, size)
+    else:
+        number = st.number_input(
+            f"Page (of {pages})",
+            min_value=1,
+            max_value=pages,
+            step=1,
+            key=key
+        )
+        page = make_page(total, number, size)
+
+    if total:
+        start = page_offset(page)
+        st.caption(f"Showing {start + 1}–{min(start + size, total)} of {total}")
+
+    return page
+
+
+# -------------------------
+# LAZY TABS
+# -------------------------
+def lazy_tabs(sections, key, *args):
+    """Render ``sections`` (tab label -> render function) as tabs.
+
+    Only the selected tab's ``render(*args)`` runs on a rerun; switching tabs
+    triggers a rerun of its own. Data shared between tabs is cached per data
+    version, so revisiting a tab does not rebuild it.
+    """
+    tabs = st.tabs(list(sections), key=key, on_change="rerun")
+
+    for tab, render in zip(tabs, sections.values()):
+        if tab.open:
+            with tab, instrumentation.measure(f"tab.{render.__name__}"):
+                render(*args)
@@ -1,5 +1,6 @@
 import streamlit as st
-import pandas as pd
+
+from core import indexes, tickets
 
 def customer_view(data):
     st.title("📦 Track your order")
@@ -11,23 +12,22 @@ def customer_view(data):
     user = st.session_state.user_profile
     customer_order_id = user["Order_ID"]
 
-    orders_df = data["orders"].copy()
+    order = indexes.orders_by_id(data).first(customer_order_id)
 
-    order = orders_df[
-        orders_df["Order_ID"] == customer_order_id
-    ].iloc[0]
+    if order is None:
+        st.error(f"Order {customer_order_id} was not found.")
+        st.stop()
 
     lifecycle = order["Lifecycle_Stage"]
 
-    tasks_df = data["tasks"].copy()
-    task_dict_df = data["dictionary"].copy()
-
     # -------------------------
     # GET CURRENT TASK FOR ORDER
     # -------------------------
-    current_task = tasks_df[
-        tasks_df["Order_ID"] == customer_order_id
-    ].iloc[0]
+    current_task = indexes.tasks_by_order(data).first(customer_order_id)
+
+    if current_task is None:
+        st.error(f"No tasks recorded yet for order {customer_order_id}.")
+        st.stop()
 
     task_id = current_task["Task_ID"]
     assigned_team = current_task["Assigned_To_Team"]
@@ -98,11 +98,10 @@ def customer_view(data):
         placeholder="Briefly describe the problem you are facing"
     )
 
-    if st.button("🚨 Submit Ticket"):
-        ticket_id = f"TCKT_{len(st.session_state.customer_tickets) + 1:04d}"
+    ticket_store = tickets.get_ticket_store()
 
-        st.session_state.customer_tickets.append({
-            "Ticket_ID": ticket_id,
+    if st.button("🚨 Submit Ticket"):
+        ticket_id = ticket_store.create_ticket({
             "Order_ID": customer_order_id,
             "Task_ID": task_id,
             "Lifecycle_Stage": lifecycle,
@@ -110,11 +109,7 @@ def customer_view(data):
             "Assigned_To_POC": assigned_poc,
             "Customer_Name": user["POC_Name"],
             "Category": ticket_reason,
-            "Description": ticket_description,
-            "Status": "Open",
-            "Status_Updated_On": pd.Timestamp.now(),
-            "Customer_Notified": False,
-            "Raised_On": pd.Timestamp.now()
+            "Description": ticket_description
         })
 
         st.success(
@@ -125,12 +120,9 @@ def customer_view(data):
     # -------------------------
     # VIEW PREVIOUS TICKETS
     # -------------------------
-    my_tickets = [
-        t for t in st.session_state.customer_tickets
-        if t["Order_ID"] == customer_order_id
-    ]
+    my_tickets = ticket_store.find(order_id=customer_order_id)
 
-    if my_tickets:
+    if not my_tickets.empty:
         st.divider()
         st.subheader("📂 Your Tickets")
-        st.dataframe(pd.DataFrame(my_tickets), use_container_width=True)
+        st.dataframe(my_tickets.drop(columns="Version"), use_container_width=True)
@@ -0,0 +1,66 @@
+import streamlit as st
+import pandas as pd
+
+from core import importtime, instrumentation
+
+# -------------------------
+# DIAGNOSTICS (ADMIN ONLY)
+# -------------------------
+def diagnostics_panel(data):
+    """Where reruns spend their time, from the in-process metrics store."""
+    store = instrumentation.get_metrics_store()
+
+    with st.expander("🩺 Diagnostics"):
+        st.caption(
+            f"Data version `{data.version}` · "
+            f"{len(store)} samples in the rolling window"
+        )
+
+        scope = st.radio(
+            "Scope",
+            ["This session", "All sessions"],
+            horizontal=True,
+            key="diagnostics_scope"
+        )
+        session = (
+            instrumentation.current_session()
+            if scope == "This session" else None
+        )
+
+        summary = store.summary(session)
+        if summary.empty:
+            st.info("No samples recorded yet.")
+        else:
+            st.dataframe(summary, use_container_width=True)
+            st.caption(
+                "Memory delta is the whole process's RSS change, so it "
+                "includes concurrent sessions' allocations."
+            )
+
+        st.markdown("**Workbook load**")
+        st.json(data.load_report, expanded=False)
+
+        if importtime.VIEW_IMPORT_SECONDS:
+            st.markdown("**View imports (first use)**")
+            st.dataframe(
+                pd.Series(
+                    importtime.VIEW_IMPORT_SECONDS, name="seconds"
+                ).to_frame(),
+                use_container_width=True
+            )
+
+        # -------------------------
+        # EXPORT
+        # -------------------------
+        st.download_button(
+            "⬇️ JSON",
+            store.to_json(),
+            file_name="governance_metrics.json",
+            mime="application/json"
+        )
+        st.download_button(
+            "⬇️ Prometheus",
+            store.to_prometheus(),
+            file_name="governance_metrics.prom",
+            mime="text/plain"
+        )
@@ -1,249 +1,211 @@
 import streamlit as st
 import pandas as pd
 
+from core import cards, indexes, tickets
+from core.pagination import page_offset, page_slice
+from views.components import lazy_tabs, page_controls
+
 # -------------------------
-# OPERATIONS PAGE
+# TICKET ACTIONS
 # -------------------------
-def operations_view(data):
-    st.title("🛠 Operations Execution Hub")
-    st.caption("Task execution, customer requests, and program escalations")
-
-    tab1, tab2, tab3 = st.tabs([
-        "📋 My Task Inbox",
-        "🎫 Customer Tickets",
-        "🚨 Program Escalations"
-    ])
-
-    # =====================================================
-    # TAB 1: MY TASK INBOX
-    # =====================================================
-    with tab1:
-        st.subheader("📋 My Active Tasks")
-        st.caption("Tasks currently in progress and assigned to you")
-
-        user_email = (
-            st.session_state.user_profile
-            .get("Login_ID", "")
-            .strip()
-            .lower()
+def move_ticket(ticket_store, ticket, to_status):
+    try:
+        ticket_store.transition(
+            ticket.ticket_id, ticket.status, to_status, ticket.version
         )
+    except tickets.TicketError as exc:
+        st.error(str(exc))
+        return False
+    return True
+
+
+# =====================================================
+# TAB 1: MY TASK INBOX
+# =====================================================
+def inbox_tab(data):
+    st.subheader("📋 My Active Tasks")
+    st.caption("Tasks currently in progress and assigned to you")
+
+    user_email = (
+        st.session_state.user_profile
+        .get("Login_ID", "")
+        .strip()
+        .lower()
+    )
+
+    # -------------------------
+    # LOAD + ENRICH TASK DATA
+    # -------------------------
+    order_tasks_index = indexes.tasks_by_order(data)
+
+    # -------------------------
+    # FILTER MY ACTIVE TASKS
+    # -------------------------
+    # Tasks already carry Task_Name and the next task from the dictionary
+    my_tasks = indexes.tasks_by_assignee(data).rows(user_email)
+
+    my_active_tasks = my_tasks[
+        my_tasks["status_clean"] == "in progress"
+    ].sort_values("Task_Start_Date", kind="stable")
+
+    st.write(f"👤 Logged in as: {st.session_state.user_profile['POC_Name']}")
+
+    if my_active_tasks.empty:
+        st.success("🎉 You have no tasks currently in progress.")
+    else:
+        # Only the visible page of tasks is rendered
+        task_page = page_controls(len(my_active_tasks), key="inbox_page")
+
+        page_tasks = page_slice(my_active_tasks, task_page)
+
+        for card in cards.task_cards(page_tasks):
+            st.divider()
+            st.markdown(card.header)
+
+            col1, col2 = st.columns(2)
+
+            # -------------------------
+            # CURRENT TASK
+            # -------------------------
+            with col1:
+                st.markdown("**🔴 Current Task (In Progress)**")
+                st.markdown(card.current)
+
+            # -------------------------
+            # NEXT TASK (FROM DICTIONARY)
+            # -------------------------
+            with col2:
+                st.markdown("**➡️ Next Task (Upcoming)**")
+                st.markdown(card.next_task)
+
+            # -------------------------
+            # COMPLETED TASKS
+            # -------------------------
+            with st.expander("📜 View journey so far (completed tasks)"):
+                order_tasks = order_tasks_index.rows(card.order_id)
+                completed_tasks = order_tasks[
+                    order_tasks["status_clean"] == "completed"
+                ]
+
+                if completed_tasks.empty:
+                    st.info("No completed tasks yet.")
+                else:
+                    st.dataframe(
+                        completed_tasks[
+                            ["Task_ID", "Task_Name", "Assigned_To_POC"]
+                        ],
+                        use_container_width=True
+                    )
 
-        # -------------------------
-        # LOAD + ENRICH TASK DATA
-        # -------------------------
-        tasks_df = data["tasks"].copy()
-        dict_df = data["dictionary"].copy()
-
-        # Normalize for matching
-        tasks_df["assigned_clean"] = (
-            tasks_df["Assigned_To_POC"]
-            .astype(str)
-            .str.strip()
-            .str.lower()
-        )
 
-        tasks_df["status_clean"] = (
-            tasks_df["Task_Status"]
-            .astype(str)
-            .str.strip()
-            .str.lower()
+# =====================================================
+# TAB 2: CUSTOMER TICKETS
+# =====================================================
+def tickets_tab(data):
+    st.subheader("🎫 Customer Tickets")
+    st.caption("Customer-raised issues assigned to you")
+
+    # Resolved tickets are closed by the background auto-close thread
+    ticket_store = tickets.get_ticket_store()
+    auto_close_hours = tickets.auto_close_window() / pd.Timedelta(hours=1)
+
+    user_email = (
+        st.session_state.user_profile
+        .get("Login_ID", "")
+        .strip()
+        .lower()
+    )
+
+    if ticket_store.count() == 0:
+        st.info("No customer tickets raised yet.")
+    else:
+        col1, col2 = st.columns(2)
+        status_filter = col1.multiselect(
+            "Status",
+            list(tickets.TICKET_TRANSITIONS),
+            key="ops_ticket_status"
         )
+        newest_first = col2.toggle("Newest first", key="ops_ticket_newest")
 
-        # 🔑 ENRICH TASKS WITH TASK NAME
-        tasks_enriched = tasks_df.merge(
-            dict_df[["Task_ID", "Task_Name", "Lifecycle_Stage"]],
-            on="Task_ID",
-            how="left",
-            suffixes=("", "_dict")
+        # Filtering, sorting and paging run in SQL; only one page is loaded
+        query = dict(assignees=[user_email], status=status_filter or None)
+        ticket_page = page_controls(
+            ticket_store.count(**query), key="ops_ticket_page"
+        )
+        my_tickets = ticket_store.find(
+            **query,
+            newest_first=newest_first,
+            limit=ticket_page.size,
+            offset=page_offset(ticket_page)
         )
 
-        # -------------------------
-        # FILTER MY ACTIVE TASKS
-        # -------------------------
-        my_active_tasks = tasks_enriched[
-            (tasks_enriched["assigned_clean"] == user_email) &
-            (tasks_enriched["status_clean"] == "in progress")
-        ]
-
-        st.write(f"👤 Logged in as: {st.session_state.user_profile['POC_Name']}")
-
-        if my_active_tasks.empty:
-            st.success("🎉 You have no tasks currently in progress.")
+        if my_tickets.empty:
+            st.success("🎉 No customer tickets assigned to you.")
         else:
-            for _, current_task in my_active_tasks.iterrows():
+            for t in cards.ticket_cards(my_tickets):
+                st.divider()
+                st.markdown(t.body)
 
-                order_id = current_task["Order_ID"]
-                lifecycle = current_task["Lifecycle_Stage"]
-                task_id = current_task["Task_ID"]
+                _, col2 = st.columns(2)
 
-                st.divider()
-                st.markdown(f"### 📦 Order `{order_id}` — {lifecycle}")
-
-                col1, col2 = st.columns(2)
-
-                # -------------------------
-                # CURRENT TASK
-                # -------------------------
-                with col1:
-                    st.markdown("**🔴 Current Task (In Progress)**")
-                    st.write(f"**Task ID:** {task_id}")
-                    st.write(f"**Task Name:** {current_task.get('Task_Name', 'N/A')}")
-                    st.write(f"**Started On:** {current_task.get('Task_Start_Date', 'N/A')}")
-
-                # -------------------------
-                # NEXT TASK (FROM DICTIONARY)
-                # -------------------------
                 with col2:
-                    st.markdown("**➡️ Next Task (Upcoming)**")
-
-                    lifecycle_tasks = dict_df[
-                        dict_df["Lifecycle_Stage"] == lifecycle
-                    ].sort_values("Task_ID")
-
-                    task_sequence = lifecycle_tasks["Task_ID"].tolist()
-
-                    if task_id in task_sequence:
-                        current_index = task_sequence.index(task_id)
-
-                        if current_index + 1 < len(task_sequence):
-                            next_task = lifecycle_tasks.iloc[current_index + 1]
-                            st.write(f"**Task ID:** {next_task['Task_ID']}")
-                            st.write(f"**Task Name:** {next_task['Task_Name']}")
-                        else:
-                            st.write("🎯 This is the final task in this lifecycle.")
-                    else:
-                        st.write("Next task not found in dictionary.")
-
-                # -------------------------
-                # COMPLETED TASKS
-                # -------------------------
-                with st.expander("📜 View journey so far (completed tasks)"):
-                    completed_tasks = tasks_enriched[
-                        (tasks_enriched["Order_ID"] == order_id) &
-                        (tasks_enriched["Task_Status"] == "Completed")
-                    ]
-
-                    if completed_tasks.empty:
-                        st.info("No completed tasks yet.")
-                    else:
-                        st.dataframe(
-                            completed_tasks[
-                                ["Task_ID", "Task_Name", "Assigned_To_POC"]
-                            ],
-                            use_container_width=True
+
+                    if t.status == "Open":
+                        if (
+                            st.button("✅ Acknowledge", key=f"ack_{t.ticket_id}")
+                            and move_ticket(ticket_store, t, "Acknowledged")
+                        ):
+                            st.success("Ticket acknowledged")
+                            st.rerun()
+
+                    elif t.status == "Acknowledged":
+                        if (
+                            st.button("🔧 Start Work", key=f"progress_{t.ticket_id}")
+                            and move_ticket(ticket_store, t, "In Progress")
+                        ):
+                            st.info("Work started on ticket")
+                            st.rerun()
+
+                    elif t.status == "In Progress":
+                        if (
+                            st.button("✅ Mark Resolved", key=f"resolve_{t.ticket_id}")
+                            and move_ticket(ticket_store, t, "Resolved")
+                        ):
+                            st.success("Ticket resolved. Customer notified.")
+                            st.rerun()
+
+                    elif t.status == "Resolved":
+                        st.warning(
+                            f"⏳ Ticket will auto-close after {auto_close_hours:g} hours"
                         )
 
-    # =====================================================
-    # TAB 2: CUSTOMER TICKETS
-    # =====================================================
-    with tab2:
-        st.subheader("🎫 Customer Tickets")
-        st.caption("Customer-raised issues assigned to you")
-    
-        # -------------------------
-        # AUTO-CLOSE RESOLVED TICKETS
-        # -------------------------
-        now = pd.Timestamp.now()
-    
-        for t in st.session_state.customer_tickets:
-            if t.get("Status") == "Resolved":
-                resolved_at = t.get("Status_Updated_On")
-    
-                if resolved_at and now - resolved_at > pd.Timedelta(hours=2):
-                    t["Status"] = "Closed"
-                    t["Status_Updated_On"] = now
-    
-        user_email = (
-            st.session_state.user_profile
-            .get("Login_ID", "")
-            .strip()
-            .lower()
-        )
-    
-        tickets = st.session_state.get("customer_tickets", [])
-    
-        if not tickets:
-            st.info("No customer tickets raised yet.")
-        else:
-            tickets_df = pd.DataFrame(tickets)
-    
-            tickets_df["assigned_poc_clean"] = (
-                tickets_df["Assigned_To_POC"]
-                .astype(str)
-                .str.strip()
-                .str.lower()
-            )
-    
-            my_tickets = tickets_df[
-                tickets_df["assigned_poc_clean"] == user_email
-            ]
-    
-            if my_tickets.empty:
-                st.success("🎉 No customer tickets assigned to you.")
-            else:
-                for _, t in my_tickets.iterrows():
-                    st.divider()
-    
-                    st.markdown(
-                        f"""
-                        **🎫 Ticket ID:** `{t['Ticket_ID']}`  
-                        **📦 Order ID:** `{t['Order_ID']}`  
-                        **🛠 Task ID:** `{t['Task_ID']}`  
-                        **👤 Customer:** {t['Customer_Name']}  
-                        **📂 Category:** {t['Category']}  
-                        **📝 Description:** {t['Description']}  
-                        **📌 Status:** {t['Status']}  
-                        **⏱ Raised On:** {t['Raised_On']}
-                        """
-                    )
-    
-                    _, col2 = st.columns(2)
-    
-                    with col2:
-    
-                        if t["Status"] == "Open":
-                            if st.button("✅ Acknowledge", key=f"ack_{t['Ticket_ID']}"):
-                                tickets_df.loc[
-                                    tickets_df["Ticket_ID"] == t["Ticket_ID"],
-                                    ["Status", "Status_Updated_On"]
-                                ] = ["Acknowledged", pd.Timestamp.now()]
-                                st.session_state.customer_tickets = tickets_df.to_dict("records")
-                                st.success("Ticket acknowledged")
-                                st.rerun()
-    
-                        elif t["Status"] == "Acknowledged":
-                            if st.button("🔧 Start Work", key=f"progress_{t['Ticket_ID']}"):
-                                tickets_df.loc[
-                                    tickets_df["Ticket_ID"] == t["Ticket_ID"],
-                                    ["Status", "Status_Updated_On"]
-                                ] = ["In Progress", pd.Timestamp.now()]
-                                st.session_state.customer_tickets = tickets_df.to_dict("records")
-                                st.info("Work started on ticket")
-                                st.rerun()
-    
-                        elif t["Status"] == "In Progress":
-                            if st.button("✅ Mark Resolved", key=f"resolve_{t['Ticket_ID']}"):
-                                tickets_df.loc[
-                                    tickets_df["Ticket_ID"] == t["Ticket_ID"],
-                                    ["Status", "Status_Updated_On", "Customer_Notified"]
-                                ] = ["Resolved", pd.Timestamp.now(), True]
-                                st.session_state.customer_tickets = tickets_df.to_dict("records")
-                                st.success("Ticket resolved. Customer notified.")
-                                st.rerun()
-    
-                        elif t["Status"] == "Resolved":
-                            st.warning("⏳ Ticket will auto-close after 2 hours")
-
-
-
-
-    # =====================================================
-    # TAB 3: PROGRAM ESCALATIONS
-    # =====================================================
-    with tab3:
-        st.subheader("🚨 Program Escalations & Requests")
-        st.info(
-            "Escalations and action requests raised by Program Managers "
-            "for delayed or at-risk orders."
-        )
-        st.caption("🚧 Coming next")
+
+# =====================================================
+# TAB 3: PROGRAM ESCALATIONS
+# =====================================================
+def escalations_tab(data):
+    st.subheader("🚨 Program Escalations & Requests")
+    st.info(
+        "Escalations and action requests raised by Program Managers "
+        "for delayed or at-risk orders."
+    )
+    st.caption("🚧 Coming next")
+
+
+# -------------------------
+# OPERATIONS PAGE
+# -------------------------
+def operations_view(data):
+    st.title("🛠 Operations Execution Hub")
+    st.caption("Task execution, customer requests, and program escalations")
+
+    # Only the selected tab is computed on each rerun
+    lazy_tabs(
+        {
+            "📋 My Task Inbox": inbox_tab,
+            "🎫 Customer Tickets": tickets_tab,
+            "🚨 Program Escalations": escalations_tab,
+        },
+        "operations_tabs",
+        data
+    )
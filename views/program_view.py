@@ -1,5 +1,8 @@
 import streamlit as st
-import pandas as pd
+
+from core import cards, derived, filters, indexes, org, search, tickets
+from core.pagination import page_offset
+from views.components import lazy_tabs, page_controls
 
 # ---------------------------------
 # LIFECYCLE → OPS TEAM ROUTING
@@ -16,347 +19,329 @@ LIFECYCLE_TO_OPS_TEAM = {
 # -------------------------
 # PROGRAM MANAGER
 # -------------------------
+# Filter widget key -> order column it filters on
+PROGRAM_FILTERS = {
+    "rag_filter": "Overall_RAG",
+    "sla_filter": "SLA_Breach_Flag",
+    "lifecycle_filter": "Lifecycle_Stage",
+    "order_type_filter": "Order_Type",
+}
+
+
 def clear_program_filters():
-    st.session_state["rag_filter"] = []
-    st.session_state["sla_filter"] = []
-    st.session_state["lifecycle_filter"] = []
+    for key in PROGRAM_FILTERS:
+        st.session_state[key] = []
+
+
+def facet_filter(facets, label, key, options=None):
+    """Multiselect over one facet, labelled with live match counts."""
+    column = PROGRAM_FILTERS[key]
+    selections = {
+        facet: st.session_state.get(widget_key, [])
+        for widget_key, facet in PROGRAM_FILTERS.items()
+    }
+    counts = facets.facet_counts(column, selections)
+
+    st.multiselect(
+        label,
+        options if options is not None else facets.values(column),
+        format_func=lambda value: f"{value} ({counts.get(value, 0)})",
+        key=key
+    )
+
+
+# ======================================================
+# TAB 1 — PROGRAM MASTER VIEW
+# ======================================================
+def master_view_tab(data):
+    st.subheader("📊 Program Master View")
+    orders_df = derived.orders_with_ageing(data)
+    st.divider()
 
+    # -------------------------
+    # KPI SUMMARY
+    # -------------------------
+    cube = derived.kpi_cube(data)
 
-def program_view(data):
-    st.title("🧭 Program Manager")
-    st.caption("End-to-end portfolio oversight and program governance")
-    orders_df = data["orders"].copy()
-    tasks_df = data["tasks"].copy()
+    total_orders = cube.total_orders
+    breached_orders = cube.breached_orders
+    at_risk_orders = cube.amber_orders
+    avg_ageing = round(derived.ageing_summary(data).mean_days, 1)
+
+    k1, k2, k3, k4 = st.columns(4)
 
-    orders_df["Order_Start_Date"] = pd.to_datetime(orders_df["Order_Start_Date"])
-    orders_df["Order_Ageing_Days"] = (
-        pd.Timestamp.today() - orders_df["Order_Start_Date"]
-    ).dt.days
+    k1.metric("📦 Total Orders", total_orders)
+    k2.metric("🔴 SLA Breaches", breached_orders)
+    k3.metric("🟠 At-Risk Orders", at_risk_orders)
+    k4.metric("⏱ Avg Ageing (Days)", avg_ageing)
+
+    st.caption("Portfolio-wide visibility with focused order-level deep dives")
+
+    st.divider()
 
     # -------------------------
-    # TOP TABS
+    # ORDER SELECTION
     # -------------------------
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "📊 Program Master View",
-        "🎫 Customer Tickets",
-        "🚨 Escalations",
-        "👥 Resource Allocation"
-    ])
-
-    # ======================================================
-    # TAB 1 — PROGRAM MASTER VIEW
-    # ======================================================
-    with tab1:
-        st.subheader("📊 Program Master View")
-        st.divider()
-
-        # -------------------------
-        # KPI SUMMARY
-        # -------------------------
-        total_orders = len(orders_df)
-        
-        breached_orders = (
-            orders_df["SLA_Breach_Flag"] == "Yes"
-        ).sum()
-        
-        at_risk_orders = (
-            orders_df["Overall_RAG"] == "Amber"
-        ).sum()
-        
-        avg_ageing = round(
-            orders_df["Order_Ageing_Days"].mean(), 1
-        )
-        
-        k1, k2, k3, k4 = st.columns(4)
-        
-        k1.metric("📦 Total Orders", total_orders)
-        k2.metric("🔴 SLA Breaches", breached_orders)
-        k3.metric("🟠 At-Risk Orders", at_risk_orders)
-        k4.metric("⏱ Avg Ageing (Days)", avg_ageing)
-        
-        st.caption("Portfolio-wide visibility with focused order-level deep dives")
-        
-        st.divider()
+    # Only the top matches for the typed query are sent to the browser
+    query = st.text_input(
+        "Search orders (Order ID or Customer)",
+        key="order_search_query"
+    )
+    matches = search.order_search(data).matches(query)
+
+    selected_option = st.selectbox(
+        "Select an order",
+        options=[""] + [label for _, label in matches]
+    )
+
+    selected_order = None
+    if selected_option:
+        selected_order = selected_option.split(search.LABEL_SEPARATOR)[0]
 
-        # -------------------------
-        # ORDER SELECTION
-        # -------------------------
-        CUSTOMER_COL = "Client_Name"
+    # -------------------------
+    # ORDER SUMMARY
+    # -------------------------
+    if selected_order:
+        order = indexes.orders_by_id(data).first(selected_order)
 
-        order_options = (
-            orders_df["Order_ID"] + " | " + orders_df[CUSTOMER_COL]
-        ).tolist()
+        st.divider()
+        st.subheader("📄 Order Summary")
 
-        selected_option = st.selectbox(
-            "Search or select an order (Order ID or Customer)",
-            options=[""] + sorted(order_options)
-        )
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Customer", order["Client_Name"])
+        c2.metric("Lifecycle Stage", order["Lifecycle_Stage"])
+        c3.metric("Order Type", order["Order_Type"])
 
-        selected_order = None
-        if selected_option:
-            selected_order = selected_option.split(" | ")[0]
+        c1.metric("RAG", order["Overall_RAG"])
+        c2.metric("SLA Breach", order["SLA_Breach_Flag"])
+        c3.metric("Order Ageing (Days)", order["Order_Ageing_Days"])
 
         # -------------------------
-        # ORDER SUMMARY
+        # DEEP DIVE
         # -------------------------
-        if selected_order:
-            order = orders_df[
-                orders_df["Order_ID"] == selected_order
-            ].iloc[0]
+        if st.button("🔍 Deep Dive into Task Execution"):
+            st.subheader("🛠 Task Execution Details")
+
+            order_tasks = indexes.tasks_by_order(data).rows(selected_order)
+
+            if "Task_Start_Date" in order_tasks.columns:
+                order_tasks = order_tasks.sort_values("Task_Start_Date")
+
+            display_cols = [
+                c for c in [
+                    "Task_ID",
+                    "Task_Name",
+                    "Task_Status",
+                    "Assigned_To",
+                    "Task_Start_Date",
+                    "Actual_Hours",
+                    "Hold_Reason_Code"
+                ]
+                if c in order_tasks.columns
+            ]
 
-            st.divider()
-            st.subheader("📄 Order Summary")
+            st.dataframe(order_tasks[display_cols], use_container_width=True)
 
-            c1, c2, c3 = st.columns(3)
-            c1.metric("Customer", order["Client_Name"])
-            c2.metric("Lifecycle Stage", order["Lifecycle_Stage"])
-            c3.metric("Order Type", order["Order_Type"])
+    # -------------------------
+    # PORTFOLIO FILTERS (ALWAYS VISIBLE)
+    # -------------------------
+    st.divider()
+    st.subheader("📊 Portfolio Filters")
 
-            c1.metric("RAG", order["Overall_RAG"])
-            c2.metric("SLA Breach", order["SLA_Breach_Flag"])
-            c3.metric("Order Ageing (Days)", order["Order_Ageing_Days"])
+    facets = filters.order_facets(data)
 
-            # -------------------------
-            # DEEP DIVE
-            # -------------------------
-            if st.button("🔍 Deep Dive into Task Execution"):
-                st.subheader("🛠 Task Execution Details")
+    # Counts next to each option reflect the other filters' selections
+    col1, col2, col3, col4 = st.columns(4)
 
-                order_tasks = tasks_df[
-                    tasks_df["Order_ID"] == selected_order
-                ]
+    with col1:
+        facet_filter(facets, "RAG Status", "rag_filter")
 
-                if "Task_Start_Date" in order_tasks.columns:
-                    order_tasks = order_tasks.sort_values("Task_Start_Date")
-
-                display_cols = [
-                    c for c in [
-                        "Task_ID",
-                        "Task_Name",
-                        "Task_Status",
-                        "Assigned_To",
-                        "Task_Start_Date",
-                        "Actual_Hours",
-                        "Hold_Reason_Code"
-                    ]
-                    if c in order_tasks.columns
-                ]
+    with col2:
+        facet_filter(facets, "SLA Breach", "sla_filter", options=["Yes", "No"])
 
-                st.dataframe(order_tasks[display_cols], use_container_width=True)
+    with col3:
+        facet_filter(facets, "Lifecycle Stage", "lifecycle_filter")
 
-        # -------------------------
-        # PORTFOLIO FILTERS (ALWAYS VISIBLE)
-        # -------------------------
-        st.divider()
-        st.subheader("📊 Portfolio Filters")
+    with col4:
+        facet_filter(facets, "Order Type", "order_type_filter")
 
-        col1, col2, col3 = st.columns(3)
+    c_apply, c_clear = st.columns(2)
 
-        with col1:
-            st.multiselect(
-                "RAG Status",
-                sorted(orders_df["Overall_RAG"].dropna().unique()),
-                key="rag_filter"
-            )
+    with c_apply:
+        apply_filters = st.button("✅ Apply Filters")
 
-        with col2:
-            st.multiselect(
-                "SLA Breach",
-                ["Yes", "No"],
-                key="sla_filter"
+    with c_clear:
+        st.button("🧹 Clear Filters", on_click=clear_program_filters)
+
+    # -------------------------
+    # FILTERED RESULTS
+    # -------------------------
+    if apply_filters:
+        if "order_filter_cache" not in st.session_state:
+            st.session_state["order_filter_cache"] = filters.FilterCache()
+
+        # Row sets are cached per data version and filter combination
+        selections = {
+            column: st.session_state[key]
+            for key, column in PROGRAM_FILTERS.items()
+        }
+        filtered_orders = orders_df.iloc[
+            filters.filtered_positions(
+                data, selections, st.session_state["order_filter_cache"]
             )
+        ]
+
+        st.divider()
+        st.subheader("📋 Filtered Orders")
 
-        with col3:
-            st.multiselect(
-                "Lifecycle Stage",
-                sorted(orders_df["Lifecycle_Stage"].dropna().unique()),
-                key="lifecycle_filter"
+        if filtered_orders.empty:
+            st.warning("No orders match selected filters.")
+        else:
+            st.dataframe(
+                filtered_orders[
+                    [
+                        "Order_ID",
+                        "Client_Name",
+                        "Lifecycle_Stage",
+                        "Order_Type",
+                        "Overall_RAG",
+                        "SLA_Breach_Flag",
+                        "Order_Ageing_Days"
+                    ]
+                ],
+                use_container_width=True
             )
 
-        c_apply, c_clear = st.columns(2)
 
-        with c_apply:
-            apply_filters = st.button("✅ Apply Filters")
+# ======================================================
+# TAB 2 — CUSTOMER TICKETS (MANAGER VIEW)
+# ======================================================
+def team_tickets_tab(data):
+    st.subheader("🎫 Customer Tickets")
+    st.caption("Tickets raised by customers for your delivery team")
 
-        with c_clear:
-            st.button("🧹 Clear Filters", on_click=clear_program_filters)
+    # -------------------------
+    # LOAD DATA
+    # -------------------------
+    org_graph = org.org_graph(data)
+    ticket_store = tickets.get_ticket_store()
 
-        # -------------------------
-        # FILTERED RESULTS
-        # -------------------------
-        if apply_filters:
-            filtered_orders = orders_df.copy()
+    if ticket_store.count() == 0:
+        st.info("No customer tickets raised yet.")
+        return
 
-            if st.session_state["rag_filter"]:
-                filtered_orders = filtered_orders[
-                    filtered_orders["Overall_RAG"].isin(st.session_state["rag_filter"])
-                ]
+    # -------------------------
+    # MANAGER CONTEXT
+    # -------------------------
+    manager_login = (
+        st.session_state.user_profile
+        .get("Login_ID", "")
+        .strip()
+        .lower()
+    )
 
-            if st.session_state["sla_filter"]:
-                filtered_orders = filtered_orders[
-                    filtered_orders["SLA_Breach_Flag"].isin(st.session_state["sla_filter"])
-                ]
+    # Find manager name from Login_ID
+    manager_name = org_graph.name_of(manager_login)
 
-            if st.session_state["lifecycle_filter"]:
-                filtered_orders = filtered_orders[
-                    filtered_orders["Lifecycle_Stage"].isin(
-                        st.session_state["lifecycle_filter"]
-                    )
-                ]
+    if manager_name is None:
+        st.error("Logged-in manager not found in Login_Credentials.")
+        return
 
-            st.divider()
-            st.subheader("📋 Filtered Orders")
-
-            if filtered_orders.empty:
-                st.warning("No orders match selected filters.")
-            else:
-                st.dataframe(
-                    filtered_orders[
-                        [
-                            "Order_ID",
-                            "Client_Name",
-                            "Lifecycle_Stage",
-                            "Order_Type",
-                            "Overall_RAG",
-                            "SLA_Breach_Flag",
-                            "Order_Ageing_Days"
-                        ]
-                    ],
-                    use_container_width=True
-                )
-
-    # ======================================================
-    # TAB 2 — CUSTOMER TICKETS (MANAGER VIEW)
-    # ======================================================
-    with tab2:
-        st.subheader("🎫 Customer Tickets")
-        st.caption("Tickets raised by customers for your delivery team")
-    
-        # -------------------------
-        # LOAD DATA
-        # -------------------------
-        creds_df = data["login"].copy()
-        tickets = st.session_state.get("customer_tickets", [])
-    
-        if not tickets:
-            st.info("No customer tickets raised yet.")
-            st.stop()
-    
-        tickets_df = pd.DataFrame(tickets)
-    
-        # -------------------------
-        # NORMALIZE CREDENTIALS
-        # -------------------------
-        creds_df["login_clean"] = (
-            creds_df["Login_ID"].astype(str).str.strip().str.lower()
-        )
-    
-        creds_df["poc_clean"] = (
-            creds_df["POC_Name"].astype(str).str.strip().str.lower()
-        )
-    
-        creds_df["reports_to_clean"] = (
-            creds_df["Reports to"].astype(str).str.strip().str.lower()
-        )
-    
-        # -------------------------
-        # MANAGER CONTEXT
-        # -------------------------
-        manager_login = (
-            st.session_state.user_profile
-            .get("Login_ID", "")
-            .strip()
-            .lower()
+    # -------------------------
+    # FIND REPORTEES BY NAME
+    # -------------------------
+    include_skip_levels = st.toggle(
+        "Include skip-level reportees", key="team_skip_levels"
+    )
+
+    if include_skip_levels:
+        reportee_logins = org_graph.all_reportees(manager_login)
+    else:
+        reportee_logins = org_graph.direct_reportees(manager_login)
+
+    if not reportee_logins:
+        st.warning(
+            f"No reportees mapped to you.\n\n"
+            f"Expected `Reports to` = {manager_name}"
         )
-    
-        # Find manager name from Login_ID
-        manager_row = creds_df[
-            creds_df["login_clean"] == manager_login
-        ]
-    
-        if manager_row.empty:
-            st.error("Logged-in manager not found in Login_Credentials.")
-            st.stop()
-    
-        manager_name = manager_row.iloc[0]["poc_clean"]
-    
-        # -------------------------
-        # FIND REPORTEES BY NAME
-        # -------------------------
-        reportees_df = creds_df[
-            creds_df["reports_to_clean"] == manager_name
-        ]
-    
-        if reportees_df.empty:
-            st.warning(
-                f"No reportees mapped to you.\n\n"
-                f"Expected `Reports to` = {manager_name}"
+        return
+
+    # -------------------------
+    # FILTER TICKETS
+    # -------------------------
+    # Only the visible page of the queue is fetched and rendered
+    team_page = page_controls(
+        ticket_store.count(assignees=reportee_logins), key="team_ticket_page"
+    )
+    my_team_tickets = ticket_store.find(
+        assignees=reportee_logins,
+        limit=team_page.size,
+        offset=page_offset(team_page)
+    )
+
+    if my_team_tickets.empty:
+        st.success("🎉 No active tickets for your team.")
+    else:
+        for t in cards.ticket_cards(my_team_tickets, cards.TEAM_TICKET_FIELDS):
+            st.divider()
+            st.markdown(t.body)
+
+            # -------------------------
+            # REASSIGNMENT
+            # -------------------------
+            new_assignee = st.selectbox(
+                "Reassign to",
+                options=reportee_logins,
+                index=reportee_logins.index(
+                    t.assignee
+                ) if t.assignee in reportee_logins else 0,
+                key=f"reassign_{t.ticket_id}"
             )
-            st.stop()
-    
-        reportee_logins = reportees_df["login_clean"].tolist()
-    
-        # -------------------------
-        # FILTER TICKETS
-        # -------------------------
-        tickets_df["assigned_poc_clean"] = (
-            tickets_df["Assigned_To_POC"]
-            .astype(str)
-            .str.strip()
-            .str.lower()
-        )
-    
-        my_team_tickets = tickets_df[
-            tickets_df["assigned_poc_clean"].isin(reportee_logins)
-        ]
-    
-        if my_team_tickets.empty:
-            st.success("🎉 No active tickets for your team.")
-        else:
-            for _, t in my_team_tickets.iterrows():
-                st.divider()
-    
-                st.markdown(
-                    f"""
-                    **🎫 Ticket ID:** `{t['Ticket_ID']}`  
-                    **📦 Order ID:** `{t['Order_ID']}`  
-                    **🛠 Task ID:** `{t['Task_ID']}`  
-                    **👤 Customer:** {t['Customer_Name']}  
-                    **👨‍🔧 Assigned Engineer:** {t['Assigned_To_POC']}  
-                    **📌 Status:** {t['Status']}  
-                    **⏱ Raised On:** {t['Raised_On']}
-                    """
-                )
-    
-                # -------------------------
-                # REASSIGNMENT
-                # -------------------------
-                new_assignee = st.selectbox(
-                    "Reassign to",
-                    options=reportee_logins,
-                    index=reportee_logins.index(
-                        t["assigned_poc_clean"]
-                    ) if t["assigned_poc_clean"] in reportee_logins else 0,
-                    key=f"reassign_{t['Ticket_ID']}"
-                )
-    
-                if st.button(
-                    "🔄 Confirm Reassignment",
-                    key=f"btn_reassign_{t['Ticket_ID']}"
-                ):
-                    tickets_df.loc[
-                        tickets_df["Ticket_ID"] == t["Ticket_ID"],
-                        ["Assigned_To_POC", "Status_Updated_On"]
-                    ] = [new_assignee, pd.Timestamp.now()]
-    
-                    st.session_state.customer_tickets = tickets_df.to_dict("records")
-    
+
+            if st.button(
+                "🔄 Confirm Reassignment",
+                key=f"btn_reassign_{t.ticket_id}"
+            ):
+                try:
+                    ticket_store.reassign(
+                        t.ticket_id, new_assignee, t.version
+                    )
+                except tickets.TicketError as exc:
+                    st.error(str(exc))
+                else:
                     st.success(f"Ticket reassigned to {new_assignee}")
                     st.rerun()
-    
 
-    with tab3:
-        st.info("🚧 Escalations — Coming soon")
 
-    with tab4:
-        st.info("🚧 Resource Allocation — Coming soon")
+# ======================================================
+# TABS 3 & 4 — COMING SOON
+# ======================================================
+def escalations_tab(data):
+    st.info("🚧 Escalations — Coming soon")
+
+
+def resource_allocation_tab(data):
+    st.info("🚧 Resource Allocation — Coming soon")
+
+
+# -------------------------
+# PROGRAM PAGE
+# -------------------------
+def program_view(data):
+    st.title("🧭 Program Manager")
+    st.caption("End-to-end portfolio oversight and program governance")
+
+    # -------------------------
+    # TOP TABS
+    # -------------------------
+    # Only the selected tab is computed on each rerun
+    lazy_tabs(
+        {
+            "📊 Program Master View": master_view_tab,
+            "🎫 Customer Tickets": team_tickets_tab,
+            "🚨 Escalations": escalations_tab,
+            "👥 Resource Allocation": resource_allocation_tab,
+        },
+        "program_tabs",
+        data
+    )